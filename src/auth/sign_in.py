@@ -1,26 +1,69 @@
 import os
-import json
+import sys
+import threading
+try:
+    import orjson
+    def load_json(raw):
+        return orjson.loads(raw)
+    def dump_json(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+    def load_json(raw):
+        return json.loads(raw)
+    def dump_json(obj):
+        return json.dumps(obj).encode()
 from PyQt5.QtWidgets import (
     QDialog, QLabel, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout, QMessageBox, QStackedWidget, QWidget, QSizePolicy
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThreadPool
 from PyQt5.QtGui import QFont
 
 USER_DATA_FILE = os.path.join(os.path.dirname(__file__), '../../users.json')
 
+def user_key(username):
+    # Usernames are trimmed and interned once at the entry points, so stored keys and lookups share one string.
+    # Case is kept: users.json already holds case-sensitive keys
+    return sys.intern(username.strip())
+
+_pending_lock = threading.Lock()  # Guards _pending_save only; held just long enough to swap it
+_pending_save = None  # Latest serialized users dict not yet on disk
+_write_lock = threading.Lock()  # Serializes the file writes; only ever taken by pool workers
+
+def _write_pending_users():
+    # Runs on the thread pool. Writes whatever snapshot is newest, so back-to-back saves coalesce and an
+    # older snapshot can never land after a newer one; the temp file + os.replace keeps users.json whole
+    global _pending_save
+    with _write_lock:
+        with _pending_lock:
+            data, _pending_save = _pending_save, None
+        if data is None:
+            return
+        tmp_path = USER_DATA_FILE + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, USER_DATA_FILE)
+
 class SignIn:
-    def __init__(self):
-        self.users = self.load_users()
+    def __init__(self, users=None):
+        # An already loaded users dict (e.g. from a previous login dialog) is reused instead of rereading the file
+        self.users = self.load_users() if users is None else users
 
     def load_users(self):
-        if os.path.exists(USER_DATA_FILE):
-            with open(USER_DATA_FILE, "r") as f:
-                return json.load(f)
-        return {}
+        # One open instead of a stat plus an open; a missing file just means no users yet
+        try:
+            with open(USER_DATA_FILE, "rb") as f:
+                return load_json(f.read())
+        except FileNotFoundError:
+            return {}
 
     def save_users(self):
-        with open(USER_DATA_FILE, "w") as f:
-            json.dump(self.users, f)
+        # Serialized here so the worker writes a consistent snapshot; self.users stays the source of truth
+        global _pending_save
+        data = dump_json(self.users)
+        with _pending_lock:
+            _pending_save = data
+        QThreadPool.globalInstance().start(_write_pending_users)
 
     def sign_in_user(self, username, password):
         if self.validate_credentials(username, password):
@@ -29,9 +72,10 @@ class SignIn:
             return False
 
     def validate_credentials(self, username, password):
-        return self.users.get(username) == password
+        return self.users.get(user_key(username)) == password
 
     def register_user(self, username, password):
+        username = user_key(username)
         if username in self.users:
             return False  # Username already exists
         self.users[username] = password
@@ -39,18 +83,21 @@ class SignIn:
         return True
 
 class LoginRegisterDialog(QDialog):
+    # Built once with the class and shared by every dialog instance, instead of a literal per construction
+    DIALOG_QSS = """
+        QDialog { background: #fff; border-radius: 18px; }
+        QLabel { font-size: 15px; color: #222; }
+        QLineEdit { border: 2px solid #ff6600; border-radius: 8px; padding: 6px 10px; font-size: 15px; background: #f7f7f7; }
+        QPushButton { background: #ff6600; color: white; border-radius: 10px; padding: 8px 0; font-size: 16px; font-weight: bold; }
+        QPushButton:hover { background: #ff8800; }
+    """
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("ECG Monitor - Sign In / Sign Up")
         self.setFixedSize(700, 400)
         self.setWindowFlags(self.windowFlags() | Qt.WindowMinMaxButtonsHint)
-        self.setStyleSheet("""
-            QDialog { background: #fff; border-radius: 18px; }
-            QLabel { font-size: 15px; color: #222; }
-            QLineEdit { border: 2px solid #ff6600; border-radius: 8px; padding: 6px 10px; font-size: 15px; background: #f7f7f7; }
-            QPushButton { background: #ff6600; color: white; border-radius: 10px; padding: 8px 0; font-size: 16px; font-weight: bold; }
-            QPushButton:hover { background: #ff8800; }
-        """)
+        self.setStyleSheet(self.DIALOG_QSS)
         self.sign_in_logic = SignIn()
         self.init_ui()
         self.result = False
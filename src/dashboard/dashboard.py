@@ -2,7 +2,7 @@ from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton, QFrame, QGridLayout, QCalendarWidget, QTextEdit,
     QDialog, QLineEdit, QComboBox, QFormLayout, QMessageBox, QSizePolicy, QStackedWidget
 )
-from PyQt5.QtGui import QFont, QPixmap, QMovie
+from PyQt5.QtGui import QFont, QPixmap, QPixmapCache, QImage
 from PyQt5.QtCore import Qt, QTimer
 import sys
 import numpy as np
@@ -14,6 +14,26 @@ import os
 import json
 import matplotlib.image as mpimg
 from dashboard.chatbot_dialog import ChatbotDialog
+from utils.fonts import cached_font
+
+HEART_IMG_PATH = "/Users/ptr/Downloads/Pratyaksh1/modularecg/assets/her.png"
+
+# Synthetic Lead II trace shown until live data is available; generated once per process
+DEMO_ECG_X = np.linspace(0, 2, 500)
+DEMO_ECG_Y = 1000 + 200 * np.sin(2 * np.pi * 2 * DEMO_ECG_X) + 50 * np.random.randn(500)
+
+def scaled_pixmap(path, width, height):
+    # Smooth rescaling is expensive, so every (path, size) pair is scaled once and kept in QPixmapCache
+    key = f"{path}:{width}x{height}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = QPixmapCache.find(path)
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap.fromImage(QImage(path))
+            QPixmapCache.insert(path, pixmap)
+        pixmap = pixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
 
 class MplCanvas(FigureCanvas):
     def __init__(self, width=4, height=2, dpi=100):
@@ -21,6 +41,20 @@ class MplCanvas(FigureCanvas):
         self.axes = fig.add_subplot(111)
         super().__init__(fig)
 
+class LazyWidget(QWidget):
+    # Placeholder that builds its real content from `factory` the first time it is shown
+    def __init__(self, factory, parent=None):
+        super().__init__(parent)
+        self._factory = factory
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def showEvent(self, event):
+        if self._factory is not None:
+            factory, self._factory = self._factory, None
+            self.layout().addWidget(factory())
+        super().showEvent(event)
+
 class SignInDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -37,7 +71,7 @@ class SignInDialog(QDialog):
         layout.setSpacing(18)
         layout.setContentsMargins(28, 24, 28, 24)
         title = QLabel("Sign In to PulseMonitor")
-        title.setFont(QFont("Arial", 16, QFont.Bold))
+        title.setFont(cached_font("Arial", 16, QFont.Bold))
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         form = QFormLayout()
@@ -76,24 +110,24 @@ class Dashboard(QWidget):
         self.setWindowFlags(self.windowFlags() | Qt.WindowMinimizeButtonHint | Qt.WindowMaximizeButtonHint | Qt.WindowCloseButtonHint)
         self.setWindowState(Qt.WindowMaximized)
         self.center_on_screen()
-        # --- Plasma GIF background ---
+        # --- Plasma background (first GIF frame, kept static to avoid full-window repaints) ---
         self.bg_label = QLabel(self)
         self.bg_label.setGeometry(0, 0, 1300, 900)
         self.bg_label.lower()
-        movie = QMovie("plasma.gif")
-        self.bg_label.setMovie(movie)
-        movie.start()
+        self.bg_label.setPixmap(QPixmap("plasma.gif").scaled(1300, 900, Qt.IgnoreAspectRatio, Qt.FastTransformation))
         # --- Central stacked widget for in-place navigation ---
         self.page_stack = QStackedWidget(self)
         # --- Dashboard main page widget ---
         self.dashboard_page = DashboardHomeWidget()
+        # Card frames are styled once here by object name instead of one stylesheet per frame
+        self.dashboard_page.setStyleSheet("QFrame#Card { background: white; border-radius: 16px; }")
         dashboard_layout = QVBoxLayout(self.dashboard_page)
         dashboard_layout.setSpacing(20)
         dashboard_layout.setContentsMargins(20, 20, 20, 20)
         # --- Header ---
         header = QHBoxLayout()
         logo = QLabel("ECG Monitor")
-        logo.setFont(QFont("Arial", 20, QFont.Bold))
+        logo.setFont(cached_font("Arial", 20, QFont.Bold))
         logo.setStyleSheet("color: #ff6600;")
         header.addWidget(logo)
         self.status_dot = QLabel()
@@ -116,7 +150,7 @@ class Dashboard(QWidget):
         header.addWidget(self.dark_btn)
         header.addStretch()
         self.user_label = QLabel(f"{self.username or 'User'}\n{self.role or ''}")
-        self.user_label.setFont(QFont("Arial", 10))
+        self.user_label.setFont(cached_font("Arial", 10))
         self.user_label.setAlignment(Qt.AlignRight)
         header.addWidget(self.user_label)
         self.sign_btn = QPushButton("Sign Out")
@@ -135,7 +169,7 @@ class Dashboard(QWidget):
         else:
             greeting = "Good Evening"
         greet = QLabel(f"<span style='font-size:18pt;font-weight:bold;'>{greeting}, {self.username or 'User'}</span><br><span style='color:#888;'>Welcome to your ECG dashboard</span>")
-        greet.setFont(QFont("Arial", 14))
+        greet.setFont(cached_font("Arial", 14))
         greet_row.addWidget(greet)
         greet_row.addStretch()
         date_btn = QPushButton("ECG Lead Test 12")
@@ -156,21 +190,20 @@ class Dashboard(QWidget):
         grid.setSpacing(20)
         # --- Heart Rate Card ---
         heart_card = QFrame()
-        heart_card.setStyleSheet("background: white; border-radius: 16px;")
+        heart_card.setObjectName("Card")
         heart_layout = QVBoxLayout(heart_card)
         heart_label = QLabel("Live Heart Rate Overview")
-        heart_label.setFont(QFont("Arial", 14, QFont.Bold))
+        heart_label.setFont(cached_font("Arial", 14, QFont.Bold))
         heart_img = QLabel()
         # Use a portable path for the heart image asset
         # heart_img_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "assets", "her.png")
         # heart_img_path = os.path.abspath(heart_img_path)
         # print(f"Pratyaksh Heart image path: {heart_img_path}")  # Debugging line to check the path
         # print(f"Pratyaksh Heart image exists: {os.path.exists(heart_img_path)}")  # Check if the file exists
-        self.heart_pixmap = QPixmap("/Users/ptr/Downloads/Pratyaksh1/modularecg/assets/her.png")
         self.heart_base_size = 220
         heart_img.setFixedSize(self.heart_base_size + 20, self.heart_base_size + 20)
         heart_img.setAlignment(Qt.AlignCenter)
-        heart_img.setPixmap(self.heart_pixmap.scaled(self.heart_base_size, self.heart_base_size, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        heart_img.setPixmap(scaled_pixmap(HEART_IMG_PATH, self.heart_base_size, self.heart_base_size))
         heart_layout.addWidget(heart_label)
         heart_layout.addWidget(heart_img)
         heart_layout.addWidget(QLabel("Stress Level: Low"))
@@ -187,7 +220,7 @@ class Dashboard(QWidget):
         ecg_card.setStyle
         ecg_layout = QVBoxLayout(ecg_card)
         ecg_label = QLabel("ECG Recording")
-        ecg_label.setFont(QFont("Arial", 12, QFont.Bold))
+        ecg_label.setFont(cached_font("Arial", 12, QFont.Bold))
         ecg_layout.addWidget(ecg_label)
         self.ecg_canvas = MplCanvas(width=4, height=2)
         self.ecg_canvas.axes.set_facecolor("#eee")
@@ -198,27 +231,30 @@ class Dashboard(QWidget):
         grid.addWidget(ecg_card, 1, 1)
         # --- Total Visitors (Pie Chart) ---
         visitors_card = QFrame()
-        visitors_card.setStyleSheet("background: white; border-radius: 16px;")
+        visitors_card.setObjectName("Card")
         visitors_layout = QVBoxLayout(visitors_card)
         visitors_label = QLabel("Total Visitors")
-        visitors_label.setFont(QFont("Arial", 12, QFont.Bold))
+        visitors_label.setFont(cached_font("Arial", 12, QFont.Bold))
         visitors_layout.addWidget(visitors_label)
-        pie_canvas = MplCanvas(width=2.5, height=2.5)
-        pie_data = [30, 25, 30, 15]
-        pie_labels = ["December", "November", "October", "September"]
-        pie_colors = ["#ff6600", "#00b894", "#636e72", "#fdcb6e"]
-        wedges, texts, autotexts = pie_canvas.axes.pie(
-            pie_data, labels=pie_labels, autopct='%1.0f%%', colors=pie_colors, startangle=90
-        )
-        pie_canvas.axes.set_aspect('equal')
-        visitors_layout.addWidget(pie_canvas)
+        def build_pie_canvas():
+            pie_canvas = MplCanvas(width=2.5, height=2.5)
+            pie_data = [30, 25, 30, 15]
+            pie_labels = ["December", "November", "October", "September"]
+            pie_colors = ["#ff6600", "#00b894", "#636e72", "#fdcb6e"]
+            wedges, texts, autotexts = pie_canvas.axes.pie(
+                pie_data, labels=pie_labels, autopct='%1.0f%%', colors=pie_colors, startangle=90
+            )
+            pie_canvas.axes.set_aspect('equal')
+            return pie_canvas
+        # The pie chart's Figure and Agg buffer are only allocated once the card is actually shown
+        visitors_layout.addWidget(LazyWidget(build_pie_canvas))
         grid.addWidget(visitors_card, 1, 2)
         # --- Schedule Card ---
         schedule_card = QFrame()
-        schedule_card.setStyleSheet("background: white; border-radius: 16px;")
+        schedule_card.setObjectName("Card")
         schedule_layout = QVBoxLayout(schedule_card)
         schedule_label = QLabel("Schedule")
-        schedule_label.setFont(QFont("Arial", 12, QFont.Bold))
+        schedule_label.setFont(cached_font("Arial", 12, QFont.Bold))
         schedule_layout.addWidget(schedule_label)
         cal = QCalendarWidget()
         cal.setFixedHeight(120)
@@ -250,10 +286,10 @@ class Dashboard(QWidget):
         grid.addWidget(schedule_card, 2, 0)
         # --- Issue Found Card ---
         issue_card = QFrame()
-        issue_card.setStyleSheet("background: white; border-radius: 16px;")
+        issue_card.setObjectName("Card")
         issue_layout = QVBoxLayout(issue_card)
         issue_label = QLabel("Issue Found")
-        issue_label.setFont(QFont("Arial", 12, QFont.Bold))
+        issue_label.setFont(cached_font("Arial", 12, QFont.Bold))
         issue_layout.addWidget(issue_label)
         issues_text = (
             "1. Heart Rate\n"
@@ -291,7 +327,7 @@ class Dashboard(QWidget):
         grid.addWidget(issue_card, 2, 1, 1, 2)
         # --- ECG Monitor Metrics Cards ---
         metrics_card = QFrame()
-        metrics_card.setStyleSheet("background: white; border-radius: 16px;")
+        metrics_card.setObjectName("Card")
         metrics_layout = QHBoxLayout(metrics_card)
         # Store metric labels for live update
         self.metric_labels = {}
@@ -306,9 +342,9 @@ class Dashboard(QWidget):
         for title, value, unit, key in metric_info:
             box = QVBoxLayout()
             lbl = QLabel(title)
-            lbl.setFont(QFont("Arial", 10, QFont.Bold))
+            lbl.setFont(cached_font("Arial", 10, QFont.Bold))
             val = QLabel(f"{value} {unit}")
-            val.setFont(QFont("Arial", 16, QFont.Bold))
+            val.setFont(cached_font("Arial", 16, QFont.Bold))
             box.addWidget(lbl)
             box.addWidget(val)
             metrics_layout.addLayout(box)
@@ -322,8 +358,8 @@ class Dashboard(QWidget):
         dashboard_layout.addWidget(self.generate_report_btn, alignment=Qt.AlignRight)
         
         # --- ECG Animation Setup ---
-        self.ecg_x = np.linspace(0, 2, 500)
-        self.ecg_y = 1000 + 200 * np.sin(2 * np.pi * 2 * self.ecg_x) + 50 * np.random.randn(500)
+        self.ecg_x = DEMO_ECG_X
+        self.ecg_y = DEMO_ECG_Y.copy()
         self.ecg_line, = self.ecg_canvas.axes.plot(self.ecg_x, self.ecg_y, color="#ff6600")
         self.anim = FuncAnimation(self.ecg_canvas.figure, self.update_ecg, interval=50, blit=True)
         # Add dashboard_page to stack
@@ -517,7 +553,7 @@ class Dashboard(QWidget):
         # Heartbeat effect: scale up and down in a sine wave pattern
         beat = 1 + 0.13 * math.sin(self.heartbeat_phase) + 0.07 * math.sin(2 * self.heartbeat_phase)
         size = int(self.heart_base_size * beat)
-        self.heart_img.setPixmap(self.heart_pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self.heart_img.setPixmap(scaled_pixmap(HEART_IMG_PATH, size, size))
         self.heartbeat_phase += 0.18  # Controls speed of beat
         if self.heartbeat_phase > 2 * math.pi:
             self.heartbeat_phase -= 2 * math.pi
@@ -37,7 +37,7 @@ class LorenzDialog(QDialog):
         canvas.draw()
 
 class LeadSequentialView(QWidget):
-    def __init__(self, leads, data, buffer_size=500, parent=None):
+    def __init__(self, leads, data_source, buffer_size=500, parent=None):
         super().__init__(parent)
 
         # Initialize settings manager
@@ -48,7 +48,7 @@ class LeadSequentialView(QWidget):
         self.setStyleSheet("background: #000;")
         self.resize(1000, 400)
         self.leads = leads
-        self.data = data
+        self.data_source = data_source  # Callable returning the samples for a lead
         self.buffer_size = buffer_size
         self.current_idx = 0
         self.timer = QTimer(self)
@@ -92,7 +92,7 @@ class LeadSequentialView(QWidget):
             def make_onclick(idx):
                 def onclick(event):
                     lead_name = self.leads[idx]
-                    d = self.data.get(lead_name, [])
+                    d = self.data_source(lead_name)
                     dlg = LorenzDialog(lead_name, d, self)
                     dlg.exec_()
                 return onclick
@@ -141,15 +141,17 @@ class LeadSequentialView(QWidget):
     def update_plot(self):
         lead = self.leads[self.current_idx]
         self.lead_label.setText(f"Lead: {lead}")
-        data = self.data.get(lead, [])
+        data = self.data_source(lead)
 
         # Apply gain setting to the displayed data
         gain_factor = self.settings_manager.get_wave_gain() / 10.0
 
         # Main plot (scrolling window)
-        if data:
+        if len(data):
             x = np.arange(len(data))
-            centered = np.array(data) - np.mean(data)
+            # Convert once and centre that array, rather than converting the samples again for the mean
+            samples = np.asarray(data, dtype=np.float32)
+            centered = samples - samples.mean()
             self.line.set_data(x, centered)
 
             ylim = 500 * gain_factor
@@ -166,10 +168,10 @@ class LeadSequentialView(QWidget):
         # --- Mini-graphs for all 12 leads ---
         n_points = 60
         for i, l in enumerate(self.leads):
-            d = self.data.get(l, [])
+            d = self.data_source(l)
             mini_line = self.mini_lines[i]
             mini_ax = self.mini_axes[i]
-            if d:
+            if len(d):
                 d = np.array(d) - np.mean(d)
                 d = d * gain_factor 
                 if len(d) > n_points:
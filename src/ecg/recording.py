@@ -10,23 +10,36 @@ from PyQt5.QtCore import QTimer, Qt, QPropertyAnimation, QEasingCurve, QTimer, p
 from utils.settings_manager import SettingsManager
 
 class ECGRecording:
-    def __init__(self):
+    def __init__(self, capacity=1 << 20):
         self.recording = False
-        self.data = []
+        # Preallocated ring buffer; once full, the oldest samples are overwritten
+        self.capacity = capacity
+        self.data = np.empty(self.capacity, dtype=np.float32)
+        self.count = 0
 
     def start_recording(self):
         self.recording = True
-        self.data = []  # Reset data for new recording
+        self.count = 0  # Reset data for new recording
         # Code to start ECG data acquisition would go here
 
+    def add_sample(self, sample):
+        if self.recording:
+            self.data[self.count % self.capacity] = sample
+            self.count += 1
+
+    def samples(self):
+        # Recorded samples in acquisition order
+        if self.count <= self.capacity:
+            return self.data[:self.count]
+        return np.roll(self.data, -(self.count % self.capacity))
+
     def stop_recording(self):
         self.recording = False
         # Code to stop ECG data acquisition would go here
 
     def save_recording(self, filename):
-        if not self.recording and self.data:
-            # Code to save self.data to a file with the given filename
-            pass
+        if not self.recording and self.count:
+            np.save(filename, self.samples())
         else:
             raise Exception("Recording is still in progress or no data to save.")
         
@@ -36,66 +49,85 @@ class Lead12BlackPage(QWidget):
         self.dashboard = dashboard
         self.setStyleSheet("background: black;")
         layout = QVBoxLayout(self)
-        self.canvases = []
-        self.lines = []
-        self.ecg_buffers = [np.zeros(5000) for _ in range(12)]
-        self.ptrs = [0 for _ in range(12)]
+        # One (lead, sample) buffer with a shared read pointer; each lead's window is a view into it
+        self.ecg_buffers = np.zeros((12, 5000), dtype=np.float32)
+        self.ptr = 0
         self.window_size = 1000
         self.lead_names = ["I", "II", "III", "aVR", "aVL", "aVF", "V1", "V2", "V3", "V4", "V5", "V6"]
-        for i in range(12):
-            label = QLabel(self.lead_names[i])
-            label.setStyleSheet("color: white; font-size: 14px; font-weight: bold; margin-bottom: 2px;")
-            label.setFixedWidth(70)
-            layout.addWidget(label, alignment=Qt.AlignLeft)
-            fig = Figure(figsize=(2, 2), facecolor='black')
-            ax = fig.add_subplot(111)
-            ax.set_facecolor('black')
-            ax.set_xticks([])
-            ax.set_yticks([])
-            ax.set_ylim(-3, 3)
-            ax.axvline(x=0, color='white', linestyle='--', linewidth=1)
-            ax.set_title("", color='white', fontsize=12, loc='left')
-            line, = ax.plot(np.zeros(self.window_size), color='lime', lw=1)
-            canvas = FigureCanvas(fig)
-            layout.addWidget(canvas)
-            self.canvases.append(canvas)
-            self.lines.append(line)
+        # All 12 traces share one canvas, stacked vertically with Lead I on top
+        self.lead_spacing = 6
+        self.lead_offsets = (self.lead_spacing * np.arange(11, -1, -1, dtype=np.float32))[:, None]
+        self.fig = Figure(figsize=(2, 24), dpi=60, facecolor='black')
+        self.fig.subplots_adjust(0, 0, 1, 1)
+        self.ax = self.fig.add_subplot(111)
+        # No spines, ticks or axis artists to traverse on each draw
+        self.ax.set_axis_off()
+        self.ax.set_xlim(0, self.window_size - 1)
+        self.ax.set_ylim(-self.lead_spacing / 2, 12 * self.lead_spacing - self.lead_spacing / 2)
+        for name, offset in zip(self.lead_names, self.lead_offsets[:, 0]):
+            self.ax.text(0.01, offset + 2, name, color='white', fontsize=14, fontweight='bold',
+                         transform=self.ax.get_yaxis_transform())
+        # Animated artists are left out of the cached background and redrawn every frame
+        # Every trace shares one x array, so per-frame updates only touch y data
+        # 1 px traces gain little from anti-aliasing, so skip Agg's AA fringe on every redraw
+        self.x = np.arange(self.window_size)
+        self.lines = [self.ax.plot(self.x, np.zeros(self.window_size) + offset, color='lime', lw=1,
+                                   antialiased=False, animated=True)[0]
+                      for offset in self.lead_offsets[:, 0]]
+        self.p_marker, = self.ax.plot([], [], 'o', color='green', label='P', markersize=8, zorder=10, animated=True)
+        self.p_texts = [self.ax.text(0, 0, 'P', color='green', fontsize=10, ha='center', va='bottom', zorder=11, animated=True)
+                        for _ in range(12 * 3)]
+        self.ax.legend(loc='upper right', fontsize=8)
+        self.canvas = FigureCanvas(self.fig)
+        # The Agg buffer covers the whole widget, so Qt need not clear the background first
+        self.canvas.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.canvas.setAttribute(Qt.WA_NoSystemBackground, True)
+        # Cached static background for blitting, refreshed on each full draw of the canvas
+        self.background = None
+        self.canvas.mpl_connect('draw_event', self.cache_background)
+        layout.addWidget(self.canvas)
         self.setLayout(layout)
+        # Single-shot timer re-armed at the end of each update so slow frames are skipped, not queued
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.update_data)
         self.timer.start(30)  # ~33 FPS
 
+    def cache_background(self, event=None):
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+
     def update_data(self):
-        for i in range(12):
-            # Slide a window over the simulated ECG for animation
-            self.ptrs[i] = (self.ptrs[i] + 1) % (len(self.ecg_buffers[i]) - self.window_size)
-            window = self.ecg_buffers[i][self.ptrs[i]:self.ptrs[i]+self.window_size]
-            self.lines[i].set_ydata(window)
+        # Slide a window over the simulated ECG for animation
+        self.ptr = (self.ptr + 1) % (self.ecg_buffers.shape[1] - self.window_size)
+        windows = self.ecg_buffers[:, self.ptr:self.ptr+self.window_size]
+        if self.background is None:
+            # Background is only available once the canvas has been drawn at its real size
+            self.canvas.draw_idle()
+        else:
+            stacked = windows + self.lead_offsets
+            self.canvas.restore_region(self.background)
+            for line, trace in zip(self.lines, stacked):
+                line.set_ydata(trace)
+                self.ax.draw_artist(line)
             # --- P peak detection and labeling for each lead ---
-            if len(window) >= 1000:
+            if windows.shape[1] >= 1000:
                 try:
                     # Placeholder for PQRST detection logic
                     p_peaks = np.array([100, 200, 300])  # Dummy values for illustration
-                    ax = self.canvases[i].figure.axes[0]
-                    main_line = ax.lines[0]
-                    ax.lines = [main_line]
-                    # Remove old text labels
-                    for txt in ax.texts:
-                        txt.remove()
                     # Plot green markers and labels for P peaks only
-                    if len(p_peaks) > 0:
-                        ax.plot(p_peaks, window[p_peaks], 'o', color='green', label='P', markersize=8, zorder=10)
-                        for idx in p_peaks:
-                            ax.text(idx, window[idx]+0.3, 'P', color='green', fontsize=10, ha='center', va='bottom', zorder=11)
-                    # Optional: update legend
-                    handles, labels = ax.get_legend_handles_labels()
-                    by_label = dict(zip(labels, handles))
-                    ax.legend(by_label.values(), by_label.keys(), loc='upper right', fontsize=8)
+                    p_x = np.tile(p_peaks, 12)
+                    p_y = stacked[:, p_peaks].ravel()
+                    self.p_marker.set_data(p_x, p_y)
+                    self.ax.draw_artist(self.p_marker)
+                    for txt, x, y in zip(self.p_texts, p_x, p_y):
+                        txt.set_position((x, y + 0.3))
+                        self.ax.draw_artist(txt)
                 except Exception as e:
-                    print(f"ECG analysis error in lead {self.lead_names[i]}:", e)
-            self.canvases[i].draw()
+                    print("ECG analysis error:", e)
+            self.canvas.blit(self.ax.bbox)
+            self.canvas.flush_events()
         # --- Lead II metrics and dashboard update (as before) ---
-        lead_ii_signal = self.ecg_buffers[1][self.ptrs[1]:self.ptrs[1]+self.window_size]
+        lead_ii_signal = windows[1]
         if len(lead_ii_signal) >= 1000:
             try:
                 # Placeholder for Lead II metrics calculation
@@ -120,6 +152,7 @@ class Lead12BlackPage(QWidget):
                     QTimer.singleShot(0, self.dashboard.repaint)
             except Exception as e:
                 print("ECG analysis error:", e)
+        self.timer.start(30)
 
 class SlidingPanel(QWidget):
     def __init__(self, parent=None):
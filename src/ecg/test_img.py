@@ -1,8 +1,18 @@
-import json
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Render offscreen; no GUI window or event loop for a one-shot preview
 import matplotlib.pyplot as plt
+try:
+    import orjson
+    def load_json(raw):
+        return orjson.loads(raw)
+except ImportError:
+    import json
+    def load_json(raw):
+        return json.loads(raw)
 
-with open('lead_ii_live.json') as f:
-    data = json.load(f)
+with open('lead_ii_live.json', 'rb') as f:
+    data = np.asarray(load_json(f.read()), dtype=np.float32)
 
 plt.figure(figsize=(10, 4))
 plt.plot(data, color='orange')
@@ -10,4 +20,4 @@ plt.title("Lead II - Latest 500 Samples")
 plt.xlabel("Sample")
 plt.ylabel("Amplitude")
 plt.grid(True)
-plt.show()
\ No newline at end of file
+plt.savefig('lead_ii_live.png', dpi=90)
@@ -1,31 +1,65 @@
+import os
+import json
+import queue
 import sys
 import time
+import select
+import shutil
+import tempfile
 import numpy as np
-from pyparsing import line
 import serial
 import serial.tools.list_ports
-import csv
-import cv2
 from datetime import datetime
+from functools import lru_cache
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox, QGroupBox, QFileDialog,
-    QStackedLayout, QGridLayout, QSizePolicy, QMessageBox, QFormLayout, QLineEdit, QFrame, QApplication
+    QStackedLayout, QSizePolicy, QMessageBox, QFormLayout, QLineEdit, QFrame, QApplication
 )
-from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QDateTime
+from PyQt5.QtGui import QFont, QImage
+from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QDateTime, QObject, QThread, QThreadPool, pyqtSignal
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.colors import to_rgba_array
+from matplotlib.artist import setp
+from matplotlib.backends.backend_pdf import PdfPages
+import matplotlib.image as mpimg
+import matplotlib.patheffects as path_effects
 from ecg.recording import ECGMenu
+from ecg.pan_tompkins import pan_tompkins
+from ecg.lead_sequential_view import LeadSequentialView
 from scipy.signal import find_peaks
 from utils.settings_manager import SettingsManager
+from utils.fonts import cached_font
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    # Fallback: run the kernels as plain Python (much slower; numba is listed in requirements.txt)
+    HAVE_NUMBA = False
+    print("numba not installed; ECG ingest and detection kernels will run as plain Python")
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# ASCII digits, deleted with bytes.translate to check that a line is all digits
+_DIGITS = bytes(range(0x30, 0x3A))
+
+# Drop shadow under each lead-grid trace; path effects hold no per-artist state, so all lines share one list
+TRACE_PATH_EFFECTS = [path_effects.SimpleLineShadow(offset=(1, 1), alpha=0.3), path_effects.Normal()]
+
+# Row order of the 12 leads derived by ingest_sample
+LEAD_ORDER = ("I", "II", "III", "aVR", "aVL", "aVF", "V1", "V2", "V3", "V4", "V5", "V6")
 
 class SerialECGReader:
     def __init__(self, port, baudrate):
         self.ser = serial.Serial(port, baudrate, timeout=1)
         self.running = False
+        self._tail = b''  # Partial line left over from the last read_batch
+        # POSIX ports expose a file descriptor that read_batch can select() on and drain in bulk
+        self._fd = self.ser.fileno() if os.name == 'posix' else None
 
     def start(self):
         self.ser.reset_input_buffer()
+        self._tail = b''
         self.ser.write(b'1\r\n')
         time.sleep(0.5)
         self.running = True
@@ -38,19 +72,104 @@ class SerialECGReader:
         if not self.running:
             return None
         try:
-            line_raw = self.ser.readline()
-            line_data = line_raw.decode('utf-8', errors='replace').strip()
-            if line_data:
-                print("Received:", line_data)
-            if line_data.isdigit():
-                return int(line_data[-3:])
+            # Parsed as bytes: no decode or int() round trip for every sample
+            line_raw = self.ser.readline().strip()
+            if line_raw and not line_raw.translate(None, _DIGITS):
+                value = 0
+                for digit in line_raw[-3:]:
+                    value = value * 10 + digit - 0x30
+                return value
         except Exception as e:
             print("Error:", e)
         return None
 
+    def fileno(self):
+        return self.ser.fileno()
+
+    def read_batch(self):
+        # Yields every complete line received so far; waits briefly while the line is idle
+        if self._fd is not None:
+            ready, _, _ = select.select([self._fd], [], [], 0.05)
+            chunk = os.read(self._fd, 65536) if ready else b''
+            if ready and not chunk:
+                raise serial.SerialException("Port reported data but returned none (device disconnected?)")
+        else:
+            chunk = self.ser.read(self.ser.in_waiting or 1)
+        lines = (self._tail + chunk).split(b'\n')
+        self._tail = lines.pop()
+        for line_raw in lines:
+            line_data = line_raw.decode('utf-8', 'replace').strip()
+            if line_data:
+                yield line_data
+
     def close(self):
         self.ser.close()
 
+class SerialWorker(QObject):
+    # (n, 8) int32 array of the samples parsed from one read
+    samples_ready = pyqtSignal(object)
+
+    def __init__(self, reader):
+        super().__init__()
+        self.reader = reader
+        self.running = False
+
+    def run(self):
+        # Runs on its own QThread so a slow or silent port never blocks the UI
+        self.running = True
+        while self.running:
+            samples = []
+            try:
+                for line_data in self.reader.read_batch():
+                    # Tokenised in C; malformed lines come back short and are skipped
+                    raw = np.fromstring(line_data, dtype=np.int32, sep=' ')
+                    if raw.size == 8:
+                        samples.append(raw)
+            except Exception as e:
+                print("Error reading serial data:", e)
+                break
+            if samples:
+                self.samples_ready.emit(np.vstack(samples))
+
+    def stop(self):
+        self.running = False
+
+class FrameEncoder(QObject):
+    """Writes captured BGR frames to a video file on its own QThread, so encoding never blocks the UI."""
+
+    def __init__(self, path, fps=30.0, max_pending=60):
+        super().__init__()
+        self.path = path
+        self.fps = fps
+        self.frames = queue.Queue(maxsize=max_pending)
+        self.frame_count = 0
+
+    def run(self):
+        import cv2
+        writer = None
+        while True:
+            frame = self.frames.get()
+            if frame is None:
+                break
+            if writer is None:
+                # Opened on the first frame, once the frame size is known
+                height, width = frame.shape[:2]
+                writer = cv2.VideoWriter(self.path, cv2.VideoWriter_fourcc(*'mp4v'), self.fps, (width, height))
+            writer.write(frame)
+            self.frame_count += 1
+        if writer is not None:
+            writer.release()
+
+    def submit(self, frame):
+        # Drop the frame rather than stall the UI when the encoder falls behind
+        try:
+            self.frames.put_nowait(frame)
+        except queue.Full:
+            pass
+
+    def finish(self):
+        self.frames.put(None)
+
 class LiveLeadWindow(QWidget):
     def __init__(self, lead_name, data_source, buffer_size=80, color="#00ff99"):
         super().__init__()
@@ -60,6 +179,9 @@ class LiveLeadWindow(QWidget):
         self.data_source = data_source
         self.buffer_size = buffer_size
         self.color = color
+        # Reused every frame; only the slots that go from data back to empty are re-filled with NaN
+        self._plot_buf = np.full(buffer_size, np.nan, dtype=np.float32)
+        self._plot_len = 0
 
         layout = QVBoxLayout(self)
         self.fig = Figure(facecolor='#000')
@@ -67,8 +189,11 @@ class LiveLeadWindow(QWidget):
         self.ax.set_facecolor('#000')
         self.ax.set_ylim(-400, 400)
         self.ax.set_xlim(0, buffer_size)
-        self.line, = self.ax.plot([0]*buffer_size, color=self.color, lw=2)
+        # Animated: the trace is blitted over a cached background instead of redrawing the axes each tick
+        self.line, = self.ax.plot(self._plot_buf, color=self.color, lw=2, antialiased=False, animated=True)
         self.canvas = FigureCanvas(self.fig)
+        self._background = None
+        self.canvas.mpl_connect('draw_event', self.cache_background)
         layout.addWidget(self.canvas)
 
         self.timer = QTimer(self)
@@ -76,17 +201,96 @@ class LiveLeadWindow(QWidget):
         self.timer.start(100)
 
     def update_plot(self):
-        data = self.data_source()
-        if data and len(data) > 0:
-            plot_data = np.full(self.buffer_size, np.nan)
-            n = min(len(data), self.buffer_size)
-            centered = np.array(data[-n:]) - np.mean(data[-n:])
-            plot_data[-n:] = centered
-            self.line.set_ydata(plot_data)
-            self.canvas.draw_idle()
+        # data_source is typically a bound ECGTestPage.get_lead_data, so this is a view into the ring buffer
+        data = np.asarray(self.data_source(), dtype=np.float32)
+        if len(data) > 0:
+            plot_buf, size, canvas = self._plot_buf, self.buffer_size, self.canvas
+            n = min(len(data), size)
+            if n < self._plot_len:
+                plot_buf[size - self._plot_len:size - n] = np.nan
+            self._plot_len = n
+            view = data[-n:]
+            np.subtract(view, view.mean(), out=plot_buf[size - n:])
+            self.line.set_ydata(plot_buf)
+            if self._background is None:
+                canvas.draw_idle()
+                return
+            canvas.restore_region(self._background)
+            self.ax.draw_artist(self.line)
+            canvas.blit(self.ax.bbox)
+
+    def cache_background(self, event=None):
+        # Re-cached after every full draw, which includes resizes
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.line)
+
+# ------------------------ Ingest one serial sample ------------------------
+
+@njit(cache=True)
+def ingest_sample(buf, head, count, running_sum, raw, lead_idx):
+    """
+    Derive the 12 leads from one 8-channel sample and store them as column `head` of the ring buffer.
+    - buf: (lead, sample) int16 ring buffer, written in place
+    - head, count: write position and number of samples already in buf
+    - running_sum: per-lead sum of the samples held in buf, updated in place
+    - raw: the 8 device channels in order I, V4, V5, II, V3, V6, V1, V2
+    - lead_idx: row of each displayed lead within LEAD_ORDER
+    Returns the next write position.
+    """
+    lead1 = raw[0]
+    lead2 = raw[3]
+    lead3 = lead2 - lead1
+    # Augmented leads are halved with a shift so everything stays in integer ADC counts
+    derived = np.empty(12, dtype=np.int16)
+    derived[0] = lead1
+    derived[1] = lead2
+    derived[2] = lead3
+    derived[3] = -((lead1 + lead2) >> 1)
+    derived[4] = (lead1 - lead3) >> 1
+    derived[5] = (lead2 + lead3) >> 1
+    derived[6] = raw[6]
+    derived[7] = raw[7]
+    derived[8] = raw[4]
+    derived[9] = raw[1]
+    derived[10] = raw[2]
+    derived[11] = raw[5]
+    full = count == buf.shape[1]
+    for row in range(lead_idx.shape[0]):
+        value = derived[lead_idx[row]]
+        if full:
+            running_sum[row] -= buf[row, head]  # Sample about to be overwritten
+        buf[row, head] = value
+        running_sum[row] += value
+    return (head + 1) % buf.shape[1]
+
+@njit(cache=True)
+def ingest_block(buf, head, count, running_sum, samples, lead_idx):
+    """
+    Store every row of an (n, 8) block of device samples with ingest_sample.
+    Returns the new write position and sample count.
+    """
+    for i in range(samples.shape[0]):
+        head = ingest_sample(buf, head, count, running_sum, samples[i], lead_idx)
+        count = min(count + 1, buf.shape[1])
+    return head, count
 
 # ------------------------ Calculate QRS axis ------------------------
 
+@lru_cache(maxsize=16)
+def _qrs_half_window(fs, window_ms):
+    # Half of the QRS integration window in samples; fs and window_ms are fixed for a session
+    return int(window_ms * fs / 1000) // 2
+
+@lru_cache(maxsize=16)
+def _st_window(fs, j_offset_ms, st_offset_ms):
+    # Samples from the R peak to the J point, and the length of the ST window after it
+    return int(j_offset_ms * fs / 1000), int(st_offset_ms * fs / 1000)
+
+@lru_cache(maxsize=1)
+def _graph_background(path):
+    # The graph-mode background is a static asset, so it is decoded once per session
+    return mpimg.imread(path)
+
 def calculate_qrs_axis(lead_I, lead_aVF, r_peaks, fs=500, window_ms=100):
     """
     Calculate QRS axis using net area of QRS complex around R peaks.
@@ -95,18 +299,19 @@ def calculate_qrs_axis(lead_I, lead_aVF, r_peaks, fs=500, window_ms=100):
     - fs: sampling rate
     - window_ms: window size around R peak (default 100 ms)
     """
+    lead_I = np.asarray(lead_I)
+    lead_aVF = np.asarray(lead_aVF)
     if len(lead_I) < 100 or len(lead_aVF) < 100 or len(r_peaks) == 0:
         return "--"
-    window = int(window_ms * fs / 1000)
-    net_I = []
-    net_aVF = []
-    for r in r_peaks:
-        start = max(0, r - window//2)
-        end = min(len(lead_I), r + window//2)
-        net_I.append(np.sum(lead_I[start:end]))
-        net_aVF.append(np.sum(lead_aVF[start:end]))
-    mean_net_I = np.mean(net_I)
-    mean_net_aVF = np.mean(net_aVF)
+    half = _qrs_half_window(fs, window_ms)
+    r_peaks = np.asarray(r_peaks, dtype=np.intp)
+    starts = np.maximum(0, r_peaks - half)
+    ends = np.minimum(len(lead_I), r_peaks + half)
+    # Window sums for every peak at once as cumulative-sum differences
+    cs_I = np.concatenate(([0.0], np.cumsum(lead_I, dtype=np.float64)))
+    cs_aVF = np.concatenate(([0.0], np.cumsum(lead_aVF, dtype=np.float64)))
+    mean_net_I = np.mean(cs_I[ends] - cs_I[starts])
+    mean_net_aVF = np.mean(cs_aVF[ends] - cs_aVF[starts])
     axis_rad = np.arctan2(mean_net_aVF, mean_net_I)
     axis_deg = int(np.degrees(axis_rad))
     return axis_deg
@@ -115,7 +320,7 @@ def calculate_qrs_axis(lead_I, lead_aVF, r_peaks, fs=500, window_ms=100):
 
 def calculate_st_segment(lead_signal, r_peaks, fs=500, j_offset_ms=40, st_offset_ms=80):
     """
-    Calculate mean ST segment amplitude (in mV) at (J-point + st_offset_ms) after R peak.
+    Calculate mean ST segment amplitude (in mV) over the st_offset_ms after the J-point of each R peak.
     - lead_signal: ECG samples (e.g., Lead II)
     - r_peaks: indices of R peaks
     - fs: sampling rate (Hz)
@@ -123,19 +328,18 @@ def calculate_st_segment(lead_signal, r_peaks, fs=500, j_offset_ms=40, st_offset
     - st_offset_ms: ms after J-point to measure ST segment (default 80ms)
     Returns mean ST segment amplitude in mV (float), or '--' if not enough data.
     """
+    lead_signal = np.asarray(lead_signal)
     if len(lead_signal) < 100 or len(r_peaks) == 0:
         return "--"
-    st_values = []
-    j_offset = int(j_offset_ms * fs / 1000)
-    st_offset = int(st_offset_ms * fs / 1000)
-    for r in r_peaks:
-        st_idx = r + j_offset + st_offset
-        if st_idx < len(lead_signal):
-            st_values.append(lead_signal[st_idx])
-    if len(st_values) == 0:
+    j_offset, st_offset = _st_window(fs, j_offset_ms, st_offset_ms)
+    starts = np.asarray(r_peaks, dtype=np.intp) + j_offset
+    starts = starts[starts < len(lead_signal)]
+    if len(starts) == 0:
         return "--"
-    
-    st_value = float(np.mean(st_values))
+    ends = np.minimum(len(lead_signal), starts + max(st_offset, 1))
+    # Mean of each ST window in O(1) from a cumulative sum, as in a moving-window integrator
+    cs = np.concatenate(([0.0], np.cumsum(lead_signal, dtype=np.float64)))
+    st_value = float(((cs[ends] - cs[starts]) / (ends - starts)).mean())
     # Interpret as medical term
     if 80 <= st_value <= 120:
         return "Isoelectric"
@@ -145,8 +349,266 @@ def calculate_st_segment(lead_signal, r_peaks, fs=500, j_offset_ms=40, st_offset
         return "Depressed"
     return str(st_value)
 
+# ------------------------ Detect PQRST peaks ------------------------
+
+@lru_cache(maxsize=16)
+def _pqrst_offsets(fs):
+    # Sample offsets of the PQRST search windows at sampling rate fs
+    return (
+        int(0.2 * fs),   # Minimum R-R distance
+        int(0.06 * fs),  # Q/S search either side of R
+        int(0.2 * fs),   # P window starts this far before Q...
+        int(0.08 * fs),  # ...and ends this far before Q; T starts this far after S
+        int(0.4 * fs),   # T window end after S
+    )
+
+@njit(cache=True)
+def _prominent_peaks_jit(x, min_prominence):
+    """
+    Indices of the local maxima of x whose prominence is at least min_prominence.
+    Same result as scipy's find_peaks(x, prominence=min_prominence), plateaus included;
+    _prominent_peaks is this scan when numba is available and find_peaks itself otherwise.
+    """
+    n = x.shape[0]
+    peaks = np.empty(n, dtype=np.int64)
+    count = 0
+    i = 1
+    while i < n - 1:
+        if x[i - 1] < x[i]:
+            ahead = i + 1
+            while ahead < n - 1 and x[ahead] == x[i]:
+                ahead += 1
+            if x[ahead] < x[i]:
+                peak = (i + ahead - 1) // 2  # Middle of a flat top
+                height = x[peak]
+                # Prominence: height above the higher of the lowest points either side, before higher ground
+                left_min = height
+                j = peak
+                while j >= 0 and x[j] <= height:
+                    if x[j] < left_min:
+                        left_min = x[j]
+                    j -= 1
+                right_min = height
+                j = peak
+                while j < n and x[j] <= height:
+                    if x[j] < right_min:
+                        right_min = x[j]
+                    j += 1
+                if height - max(left_min, right_min) >= min_prominence:
+                    peaks[count] = peak
+                    count += 1
+                i = ahead
+        i += 1
+    return peaks[:count]
+
+def _prominent_peaks_scipy(x, min_prominence):
+    return find_peaks(x, prominence=min_prominence)[0]
+
+# Interpreted, the scan above is far slower than scipy, so it is only used when compiled
+_prominent_peaks = _prominent_peaks_jit if HAVE_NUMBA else _prominent_peaks_scipy
+
+@njit(cache=True)
+def _wave_peaks(ecg_signal, r_peaks, qs_win, p_lo, gap, t_hi, wave_prominence):
+    """
+    Q, S, P and T indices around the given R peaks, in one compiled pass.
+    Returns (p_peaks, q_peaks, s_peaks, t_peaks) as int64 arrays.
+    """
+    n = ecg_signal.shape[0]
+    m = r_peaks.shape[0]
+    q_peaks = np.empty(m, dtype=np.int64)
+    s_peaks = np.empty(m, dtype=np.int64)
+    p_peaks = np.empty(m, dtype=np.int64)
+    t_peaks = np.empty(m, dtype=np.int64)
+    nq = ns = npk = nt = 0
+    # Q and S: local minima before and after R
+    for k in range(m):
+        r = r_peaks[k]
+        q_start = max(0, r - qs_win)
+        if r > q_start:
+            q_peaks[nq] = q_start + np.argmin(ecg_signal[q_start:r])
+            nq += 1
+        s_end = min(n, r + qs_win)
+        if s_end > r:
+            s_peaks[ns] = r + np.argmin(ecg_signal[r:s_end])
+            ns += 1
+    # P: last positive peak before Q (within 0.1-0.2s)
+    for k in range(nq):
+        q = q_peaks[k]
+        p_start = max(0, q - p_lo)
+        p_end = q - gap
+        if p_end > p_start:
+            candidates = _prominent_peaks(ecg_signal[p_start:p_end], wave_prominence)
+            if candidates.shape[0] > 0:
+                p_peaks[npk] = p_start + candidates[-1]
+                npk += 1
+    # T: highest positive peak after S (within 0.1-0.4s)
+    for k in range(ns):
+        t_start = s_peaks[k] + gap
+        t_end = min(n, s_peaks[k] + t_hi)
+        if t_end > t_start:
+            candidates = _prominent_peaks(ecg_signal[t_start:t_end], wave_prominence)
+            if candidates.shape[0] > 0:
+                best = candidates[0]
+                for c in candidates[1:]:
+                    if ecg_signal[t_start + c] > ecg_signal[t_start + best]:
+                        best = c
+                t_peaks[nt] = t_start + best
+                nt += 1
+    return p_peaks[:npk], q_peaks[:nq], s_peaks[:ns], t_peaks[:nt]
+
+def detect_pqrst(ecg_signal, fs):
+    """
+    Locate P, Q, R, S and T peaks in a centred ECG trace.
+    - ecg_signal: centred samples (e.g., Lead II)
+    - fs: sampling rate (Hz)
+    Returns (p_peaks, q_peaks, r_peaks, s_peaks, t_peaks) as sample indices.
+    """
+    r_distance, qs_win, p_lo, gap, t_hi = _pqrst_offsets(fs)
+    std_sig = np.std(ecg_signal)
+    # R peak detection
+    r_peaks, _ = find_peaks(ecg_signal, distance=r_distance, prominence=0.6 * std_sig)
+    # Everything hung off the R peaks is searched in one compiled call (float64, as scipy compares prominences)
+    p_peaks, q_peaks, s_peaks, t_peaks = _wave_peaks(np.asarray(ecg_signal, dtype=np.float64), r_peaks.astype(np.int64),
+                                                     qs_win, p_lo, gap, t_hi, float(0.1 * std_sig))
+    return p_peaks, q_peaks, r_peaks, s_peaks, t_peaks
+
 # ------------------------ Calculate Arrhythmia ------------------------
 
+# Result strings of _classify_rhythm, indexed by the code it returns
+RHYTHM_TABLE = (
+    "None Detected",
+    "Detecting...",
+    "Asystole (Flatline)",
+    "No QRS Detected",
+    "Ventricular Fibrillation (VF)",
+    "Ventricular Tachycardia (VT)",
+    "Sinus Bradycardia",
+    "Sinus Tachycardia",
+    "Supraventricular Tachycardia (SVT)",
+    "Atrial Fibrillation (AFib)",
+    "Atrial Flutter (suggestive)",
+    "Premature Atrial Contraction (PAC)",
+    "Premature Ventricular Contraction (PVC)",
+    "Heart Block (1° AV)",
+    "Heart Block (2°/3° AV, dropped QRS)",
+)
+
+@njit(cache=True)
+def _peak_to_peak(signal):
+    # One min/max pass; only run by the two branches that look at the amplitude
+    lo = signal[0]
+    hi = signal[0]
+    for i in range(1, signal.shape[0]):
+        if signal[i] < lo:
+            lo = signal[i]
+        elif signal[i] > hi:
+            hi = signal[i]
+    return hi - lo
+
+@njit(cache=True)
+def _classify_rhythm(rr, heart_rate, qrs_duration, pr_interval, p_peaks, r_peaks, ecg_signal, has_p, has_r, has_signal):
+    """
+    Decision tree behind detect_arrhythmia, returning an index into RHYTHM_TABLE.
+    - heart_rate, qrs_duration, pr_interval: NaN when not measured
+    - p_peaks, r_peaks, ecg_signal: empty arrays when not given, flagged by has_p / has_r / has_signal
+    Inputs detect_arrhythmia could not evaluate (a missing signal or heart rate it needs) give code 1.
+    """
+    n = rr.shape[0]
+    if n < 2:
+        return 1
+    # RR mean and (population) standard deviation in one pass
+    total = 0.0
+    total_sq = 0.0
+    for i in range(n):
+        total += rr[i]
+        total_sq += rr[i] * rr[i]
+    rr_mean = total / n
+    rr_std = np.sqrt(max(total_sq / n - rr_mean * rr_mean, 0.0))
+    rr_reg = rr_std < 0.12  # Regular if std < 120ms
+    hr_set = not np.isnan(heart_rate) and heart_rate != 0
+    qrs_set = not np.isnan(qrs_duration) and qrs_duration != 0
+    # Fast path for the common case, a regular normal-rate narrow-QRS rhythm: without R peaks and a
+    # long PR none of the checks below can fire, so skip straight to the answer
+    if (rr_reg and hr_set and 60 <= heart_rate <= 100 and qrs_set and qrs_duration <= 120
+            and not has_r and not pr_interval > 200):
+        return 0
+    p_count = p_peaks.shape[0]
+    r_count = r_peaks.shape[0]
+    # Asystole: flatline (no R peaks, or very low amplitude)
+    if has_r and r_count < 1:
+        if has_signal:
+            if ecg_signal.shape[0] == 0:
+                return 1
+            if _peak_to_peak(ecg_signal) < 50:
+                return 2
+        return 3
+    # VF: highly irregular, no clear QRS, rapid undulating
+    if has_r and r_count > 5 and rr_std > 0.25:
+        if not has_signal or ecg_signal.shape[0] == 0:
+            return 1
+        if _peak_to_peak(ecg_signal) > 100 and hr_set and heart_rate > 180:
+            return 4
+    # VT: HR > 100, wide QRS (>120ms), regular
+    if hr_set and heart_rate > 100 and qrs_set and qrs_duration > 120 and rr_reg:
+        return 5
+    # Sinus Bradycardia: HR < 60, regular
+    if hr_set and heart_rate < 60 and rr_reg:
+        return 6
+    # Sinus Tachycardia: HR > 100, regular
+    if hr_set and heart_rate > 100 and qrs_set and qrs_duration <= 120 and rr_reg:
+        return 7
+    # SVT: HR > 150, narrow QRS, regular
+    if hr_set and heart_rate > 150 and qrs_set and qrs_duration <= 120 and rr_reg:
+        return 8
+    # AFib: Irregular RR, absent/irregular P
+    if not rr_reg:
+        if not has_p:
+            return 9
+        if not has_r:
+            return 1
+        if p_count < r_count * 0.5:
+            return 9
+    # Atrial Flutter: (not robust, but if HR ~150, regular, and P waves rapid)
+    if hr_set and 140 < heart_rate < 170 and rr_reg and has_p:
+        if not has_r:
+            return 1
+        if p_count > r_count:
+            return 10
+    # PAC: Early P, narrow QRS, compensatory pause (approximate)
+    if has_p and has_r and p_count > 1 and r_count > 1:
+        if not has_signal:
+            return 1
+        limit = -0.15 * ecg_signal.shape[0]
+        early = False
+        for i in range(1, min(p_count, r_count)):
+            if (r_peaks[i] - p_peaks[i]) - (r_peaks[i - 1] - p_peaks[i - 1]) < limit:
+                early = True
+                break
+        if early and qrs_set and qrs_duration <= 120:
+            return 11
+    # PVC: Early wide QRS, no P, compensatory pause (approximate)
+    if qrs_set and qrs_duration > 120:
+        if not has_p:
+            return 12
+        if not has_r:
+            return 1
+        if p_count < r_count * 0.5:
+            return 12
+    # Heart Block: PR > 200ms (1°), dropped QRS (2°), AV dissociation (3°)
+    if not np.isnan(pr_interval) and pr_interval > 200:
+        return 13
+    # If QRS complexes are missing (dropped beats)
+    if has_r:
+        if not has_signal or np.isnan(heart_rate):
+            return 1
+        if r_count < ecg_signal.shape[0] / 500 * heart_rate * 0.7:
+            return 14
+    return 0
+
+# Stand-ins for peak and signal arguments that were not given
+_EMPTY_PEAKS = np.empty(0, dtype=np.int64)
+_EMPTY_SIGNAL = np.empty(0, dtype=np.float64)
+
 def detect_arrhythmia(heart_rate, qrs_duration, rr_intervals, pr_interval=None, p_peaks=None, r_peaks=None, ecg_signal=None):
     """
     Expanded arrhythmia detection logic for common clinical arrhythmias.
@@ -161,58 +623,36 @@ def detect_arrhythmia(heart_rate, qrs_duration, rr_intervals, pr_interval=None,
     - Asystole: Flatline (very low amplitude, no R)
     - SVT: HR > 150, narrow QRS, regular
     - Heart Block: PR > 200 (1°), dropped QRS (2°), AV dissociation (3°)
+    The classification itself runs in the compiled _classify_rhythm kernel.
     """
     try:
         if rr_intervals is None or len(rr_intervals) < 2:
             return "Detecting..."
-        rr_std = np.std(rr_intervals)
-        rr_mean = np.mean(rr_intervals)
-        rr_reg = rr_std < 0.12  # Regular if std < 120ms
-        # Asystole: flatline (no R peaks, or very low amplitude)
-        if r_peaks is not None and len(r_peaks) < 1:
-            if ecg_signal is not None and np.ptp(ecg_signal) < 50:
-                return "Asystole (Flatline)"
-            return "No QRS Detected"
-        # VF: highly irregular, no clear QRS, rapid undulating
-        if r_peaks is not None and len(r_peaks) > 5:
-            if rr_std > 0.25 and np.ptp(ecg_signal) > 100 and heart_rate and heart_rate > 180:
-                return "Ventricular Fibrillation (VF)"
-        # VT: HR > 100, wide QRS (>120ms), regular
-        if heart_rate and heart_rate > 100 and qrs_duration and qrs_duration > 120 and rr_reg:
-            return "Ventricular Tachycardia (VT)"
-        # Sinus Bradycardia: HR < 60, regular
-        if heart_rate and heart_rate < 60 and rr_reg:
-            return "Sinus Bradycardia"
-        # Sinus Tachycardia: HR > 100, regular
-        if heart_rate and heart_rate > 100 and qrs_duration and qrs_duration <= 120 and rr_reg:
-            return "Sinus Tachycardia"
-        # SVT: HR > 150, narrow QRS, regular
-        if heart_rate and heart_rate > 150 and qrs_duration and qrs_duration <= 120 and rr_reg:
-            return "Supraventricular Tachycardia (SVT)"
-        # AFib: Irregular RR, absent/irregular P
-        if not rr_reg and (p_peaks is None or len(p_peaks) < len(r_peaks) * 0.5):
-            return "Atrial Fibrillation (AFib)"
-        # Atrial Flutter: (not robust, but if HR ~150, regular, and P waves rapid)
-        if heart_rate and 140 < heart_rate < 170 and rr_reg and p_peaks is not None and len(p_peaks) > len(r_peaks):
-            return "Atrial Flutter (suggestive)"
-        # PAC: Early P, narrow QRS, compensatory pause (approximate)
-        if p_peaks is not None and r_peaks is not None and len(p_peaks) > 1 and len(r_peaks) > 1:
-            pr_diffs = np.diff([r - p for p, r in zip(p_peaks, r_peaks)])
-            if np.any(pr_diffs < -0.15 * len(ecg_signal)) and qrs_duration and qrs_duration <= 120:
-                return "Premature Atrial Contraction (PAC)"
-        # PVC: Early wide QRS, no P, compensatory pause (approximate)
-        if qrs_duration and qrs_duration > 120 and (p_peaks is None or len(p_peaks) < len(r_peaks) * 0.5):
-            return "Premature Ventricular Contraction (PVC)"
-        # Heart Block: PR > 200ms (1°), dropped QRS (2°), AV dissociation (3°)
-        if pr_interval and pr_interval > 200:
-            return "Heart Block (1° AV)"
-        # If QRS complexes are missing (dropped beats)
-        if r_peaks is not None and len(r_peaks) < len(ecg_signal) / 500 * heart_rate * 0.7:
-            return "Heart Block (2°/3° AV, dropped QRS)"
-        return "None Detected"
+        code = _classify_rhythm(
+            np.asarray(rr_intervals, dtype=np.float64),
+            np.nan if heart_rate is None else float(heart_rate),
+            np.nan if qrs_duration is None else float(qrs_duration),
+            np.nan if pr_interval is None else float(pr_interval),
+            _EMPTY_PEAKS if p_peaks is None else np.asarray(p_peaks, dtype=np.int64),
+            _EMPTY_PEAKS if r_peaks is None else np.asarray(r_peaks, dtype=np.int64),
+            _EMPTY_SIGNAL if ecg_signal is None else np.asarray(ecg_signal, dtype=np.float64),
+            p_peaks is not None, r_peaks is not None, ecg_signal is not None,
+        )
+        return RHYTHM_TABLE[code]
     except Exception as e:
         return "Detecting..."
 
+def warm_up_kernels():
+    # Compiles the numba kernels on tiny inputs so the first serial batch doesn't pay for it;
+    # run on the thread pool, off the GUI thread
+    ingest_block(np.zeros((1, 1), dtype=np.int16), 0, 0, np.zeros(1), np.zeros((1, 8), dtype=np.int32), np.zeros(1, dtype=np.int32))
+    detect_arrhythmia(75.0, 90.0, np.full(4, 0.8))
+    detect_pqrst(np.zeros(8), 500)
+
+def _format_metric(value):
+    # int() is still needed: under NumPy 1.x round() of an np.float64 returns a float64, not an int
+    return f"{int(round(value))}" if isinstance(value, (int, float)) else str(value)
+
 class ECGTestPage(QWidget):
     LEADS_MAP = {
         "Lead II ECG Test": ["I", "II", "III", "aVR", "aVL", "aVF", "V1", "V2", "V3", "V4", "V5", "V6"],
@@ -235,6 +675,105 @@ class ECGTestPage(QWidget):
         "V5": "#00b894",
         "V6": "#ff0066"
     }
+    # Metric label colours live in one stylesheet on the metrics frame, matched by object name,
+    # so a theme change is a single setStyleSheet instead of one per label
+    METRIC_LABELS_QSS = """
+        QLabel#metric_title {{ color: {title}; margin-bottom: 5px; border: none; }}
+        QLabel#heart_rate_value {{ color: {heart_rate}; background: transparent; padding: 0; border: none; margin: 0; }}
+        QLabel#pr_interval_value {{ color: {pr_interval}; background: transparent; padding: 4px 0px; border: none; }}
+        QLabel#qrs_duration_value {{ color: {qrs_duration}; background: transparent; padding: 4px 0px; border: none; }}
+        QLabel#qrs_axis_value {{ color: {qrs_axis}; background: transparent; padding: 4px 0px; border: none; }}
+        QLabel#st_segment_value {{ color: {st_segment}; background: transparent; padding: 4px 0px; border: none; }}
+        QLabel#time_elapsed_value {{ color: {time_elapsed}; background: transparent; padding: 4px 0px; border: none; }}
+    """
+    METRICS_QSS_DARK = """
+        QFrame#metrics_frame {
+            background: #000000;
+            border: 2px solid #333333;
+            border-radius: 6px;
+            padding: 4px;
+            margin: 2px 0;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.3);
+        }
+    """ + METRIC_LABELS_QSS.format(title="#00ff00", heart_rate="#ff0000", pr_interval="#ff0000", qrs_duration="#ffff00",
+                                   qrs_axis="#ffff00", st_segment="#0000ff", time_elapsed="#ffffff")
+    METRICS_QSS_MEDICAL = """
+        QFrame#metrics_frame {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                stop:0 #f0fff0, stop:1 #e0f0e0);
+            border: 2px solid #4CAF50;
+            border-radius: 6px;
+            padding: 4px;
+            margin: 2px 0;
+            box-shadow: 0 4px 15px rgba(76,175,80,0.2);
+        }
+    """ + METRIC_LABELS_QSS.format(title="#2e7d32", heart_rate="#d32f2f", pr_interval="#d32f2f", qrs_duration="#f57c00",
+                                   qrs_axis="#f57c00", st_segment="#1976d2", time_elapsed="#388e3c")
+    METRICS_QSS_LIGHT = """
+        QFrame#metrics_frame {
+            background: #ffffff;
+            border: 2px solid #e0e0e0;
+            border-radius: 6px;
+            padding: 4px;
+            margin: 2px 0;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+        }
+    """ + METRIC_LABELS_QSS.format(title="#666", heart_rate="#ff0000", pr_interval="#ff0000", qrs_duration="#ff8f00",
+                                   qrs_axis="#ff8f00", st_segment="#1976d2", time_elapsed="#424242")
+    FRAME_INTERVAL_MS = 33  # ~30 FPS target for draw_timer
+    MAX_FRAME_INTERVAL_MS = 250  # Slowest rate draw_timer backs off to when frames are expensive
+    # (calculate_ecg_intervals key, metric label key) for the numeric metrics shown above the grid
+    METRIC_KEYS = (('Heart_Rate', 'heart_rate'), ('PR', 'pr_interval'), ('QRS', 'qrs_duration'), ('ST', 'st_segment'))
+    LIVE_EXPORT_INTERVAL_S = 0.25  # lead_ii_live.json is rewritten at ~4 Hz rather than every frame
+    INTERVAL_MIN_NEW_SAMPLES = 50  # Live interval (Pan-Tompkins) job is resubmitted only after this many new samples
+    AXIS_ST_INTERVAL_S = 1.0  # Detailed view recomputes QRS axis / ST segment at most once a second
+    PQRST_MIN_NEW_SAMPLES = 25  # Detailed-view PQRST detection reruns only after this many new samples
+    # Overlay mode style templates: (axes, tick_params, ylabel color, spines, lines) applied in bulk on mode switch
+    LIGHT_AXES_KW = dict(axes={'facecolor': '#ffffff'}, ticks=dict(colors='#333333', labelsize=10), label='#333333',
+                         spines=dict(visible=True, color='#333333', linewidth=1.0), lines=dict(color='#0066cc', linewidth=2.0))
+    DARK_AXES_KW = dict(axes={'facecolor': '#000'}, ticks=dict(colors='#00ff00', labelsize=10), label='#00ff00',
+                        spines=dict(visible=False), lines=dict(color='#00ff00', linewidth=2.0))
+    GRAPH_AXES_KW = dict(axes={'facecolor': 'none', 'xticks': [], 'yticks': []}, spines=dict(visible=False),
+                         lines=dict(color='#cc0000', linewidth=2.5, alpha=1.0))
+    MENU_BUTTON_QSS = """
+        QPushButton#menuButton {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+                stop:0 #ffffff, stop:1 #f8f9fa);
+            color: #1a1a1a;
+            border: 3px solid #e9ecef;
+            border-radius: 15px;
+            padding: 20px 30px;
+            font-size: 18px;
+            font-weight: bold;
+            text-align: left;
+            margin: 4px 0;
+        }
+        QPushButton#menuButton:hover {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+                stop:0 #fff5f0, stop:1 #ffe0cc);
+            transform: translateY(-3px);
+            box-shadow: 0 8px 25px rgba(255,102,0,0.5);
+        }
+        QPushButton#menuButton:pressed {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+                stop:0 #ffe0cc, stop:1 #ffcc99);
+        }
+    """
+    # Hover/pressed colours, one copy per distinct accent
+    MENU_BUTTON_ACCENT_QSS = """
+        QPushButton#menuButton[accent="{color}"]:hover,
+        QPushButton#menuButton[accent="{color}"]:pressed {{
+            border: 4px solid {color};
+            color: {color};
+        }}
+    """
+    # Computed interval dicts; delivered queued so producers never touch the metric labels directly
+    metrics_ready = pyqtSignal(dict)
+    # (filename, saved) from the screenshot encoder running on the thread pool
+    screenshot_saved = pyqtSignal(str, bool)
+    # Stop-time Lead II summary computed on the thread pool, bound for dashboard_callback
+    dashboard_metrics_ready = pyqtSignal(dict)
+
     def __init__(self, test_name, stacked_widget):
         super().__init__()
         self.setWindowTitle("12-Lead ECG Monitor")
@@ -255,19 +794,63 @@ class ECGTestPage(QWidget):
         self.test_name = test_name
         self.leads = self.LEADS_MAP[test_name]
         self.buffer_size = 2000  # Increased buffer size for all leads
-        self.data = {lead: [] for lead in self.leads}
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_plot)
+        # (lead, sample) ring buffer of raw ADC counts written one column per sample; int16 keeps it small
+        self._buf = np.zeros((len(self.leads), self.buffer_size), dtype=np.int16)
+        # Chronological float copy of _buf, refreshed once per tick; slots not yet written are NaN
+        self._unwrap = np.full((len(self.leads), self.buffer_size), np.nan, dtype=np.float32)
+        self._head = 0
+        self._count = 0
+        self._samples_in = 0  # Total samples ingested, so views can tell how far the window has moved
+        self._buffer_stale = False  # _unwrap/_centered lag _buf; refreshed lazily by sync_buffer_views
+        self._sum = np.zeros(len(self.leads))  # Per-lead sum of the buffered samples, for the running mean
+        self._centered = self._unwrap.copy()  # _unwrap minus each lead's running mean
+        self._plot_scratch = self._unwrap.copy()  # Gain-scaled rows handed to the grid lines, reused every frame
+        # Overlay views stretch a partly filled buffer across the full width; these are the output
+        # positions in [0, 1], scaled by n - 1 per frame rather than rebuilt with linspace
+        self._stretch_base = np.linspace(0.0, 1.0, self.buffer_size, dtype=np.float32)
+        self._overlay_scratch = self._unwrap.copy()  # Gain-scaled rows for the overlay views, reused every frame
+        self._nan_row = np.full(self.buffer_size, np.nan, dtype=np.float32)  # Blank trace for overlay leads without data; never written
+        # Row of each displayed lead within the 12 derived leads computed per sample
+        self._lead_idx = np.fromiter((LEAD_ORDER.index(lead) for lead in self.leads), dtype=np.int32)
+        # Lead colours parsed to RGBA once, rather than from hex on every line (re)build
+        self._lead_rgba = to_rgba_array([self.LEAD_COLORS.get(lead, '#ff6600') for lead in self.leads])
+        # Compile the kernels in the background rather than on the first serial batch or in this constructor
+        if HAVE_NUMBA:
+            QThreadPool.globalInstance().start(warm_up_kernels)
+        # All views are redrawn from one ~30 FPS timer, independent of how fast samples arrive;
+        # ingest_samples marks them dirty and each is repainted at most once per frame.
+        # The same tick drives the elapsed-time label and screen-recording capture.
+        self.draw_timer = QTimer()
+        self.draw_timer.timeout.connect(self.refresh_views)
+        self._frame_cost = 0.0  # Smoothed seconds spent per refresh_views call
+        self._dirty = {'grid': False, 'detail': False, 'overlay': False, 'metrics': False}
+        self._detail_updater = None
+        self._overlay_updater = None
+        self._detail_canvas = None  # Detailed single-lead view, built on first expand_lead
+        self._pqrst_cache = None  # (_samples_in at detection, absolute P/Q/R/S/T sample indices)
+        self._axis_st = None  # Last (qrs_axis, st_segment) from the detailed view, and when it was computed
+        self._axis_st_time = 0.0
+        # Metric results are coalesced: only the newest pending dict is applied, once per event-loop pass
+        self._pending_metrics = None
+        self._intervals_in_flight = False  # At most one interval job on the thread pool at a time
+        self._intervals_at = 0  # _samples_in when the last interval job was submitted
+        self._last_live_export = 0.0  # perf_counter time of the last lead_ii_live.json write
+        self.metrics_ready.connect(self._queue_metrics, Qt.QueuedConnection)
+        self.screenshot_saved.connect(self._report_screenshot, Qt.QueuedConnection)
+        self.dashboard_metrics_ready.connect(self._deliver_dashboard_metrics, Qt.QueuedConnection)
         self.serial_reader = None
+        self.serial_thread = None
+        self.serial_worker = None
+        QApplication.instance().aboutToQuit.connect(self.stop_serial_worker)
         self.stacked_widget = stacked_widget
         self.lines = []
         self.axs = []
-        self.canvases = []
+        self.fig = None
+        self.canvas = None
+        self._background = None
 
-        # Initialize time tracking for elapsed time
+        # Initialize time tracking for elapsed time (shown by refresh_views on each frame)
         self.start_time = None
-        self.elapsed_timer = QTimer()
-        self.elapsed_timer.timeout.connect(self.update_elapsed_time)
 
         main_vbox = QVBoxLayout()
 
@@ -358,78 +941,22 @@ class ECGTestPage(QWidget):
             ("Exit", self.ecg_menu.show_exit, "#6c757d"),
         ]
         
-        # Create buttons and store them in a list
-        created_buttons = []
+        # Create buttons; each is tagged with its accent colour for the shared menu stylesheet
         for text, handler, color in menu_buttons:
             btn = QPushButton(text)
+            btn.setObjectName("menuButton")
+            btn.setProperty("accent", color)
             btn.setFixedHeight(77)
             btn.clicked.connect(handler)
-            created_buttons.append(btn)
             menu_layout.addWidget(btn)
 
         menu_layout.addStretch(1)
 
-        # Style menu buttons AFTER they're created
-        for i, btn in enumerate(created_buttons):
-            color = menu_buttons[i][2]
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                        stop:0 #ffffff, stop:1 #f8f9fa);
-                    color: #1a1a1a;
-                    border: 3px solid #e9ecef;
-                    border-radius: 15px;
-                    padding: 20px 30px;
-                    font-size: 18px;
-                    font-weight: bold;
-                    text-align: left;
-                    margin: 4px 0;
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                        stop:0 #fff5f0, stop:1 #ffe0cc);
-                    border: 4px solid {color};
-                    color: {color};
-                    transform: translateY(-3px);
-                    box-shadow: 0 8px 25px rgba(255,102,0,0.5);
-                }}
-                QPushButton:pressed {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                        stop:0 #ffe0cc, stop:1 #ffcc99);
-                    border: 4px solid {color};
-                    color: {color};
-                }}
-            """)
-
-        created_buttons[0].clicked.disconnect()
-        created_buttons[0].clicked.connect(self.ecg_menu.show_save_ecg)
-        
-        created_buttons[1].clicked.disconnect()
-        created_buttons[1].clicked.connect(self.ecg_menu.open_ecg_window)
-        
-        created_buttons[2].clicked.disconnect()
-        created_buttons[2].clicked.connect(self.ecg_menu.show_working_mode)
-        
-        created_buttons[3].clicked.disconnect()
-        created_buttons[3].clicked.connect(self.ecg_menu.show_printer_setup)
-        
-        created_buttons[4].clicked.disconnect()
-        created_buttons[4].clicked.connect(self.ecg_menu.set_filter_setup)
-        
-        created_buttons[5].clicked.disconnect()
-        created_buttons[5].clicked.connect(self.ecg_menu.show_system_setup)
-        
-        created_buttons[6].clicked.disconnect()
-        created_buttons[6].clicked.connect(self.ecg_menu.show_load_default)
-        
-        created_buttons[7].clicked.disconnect()
-        created_buttons[7].clicked.connect(self.ecg_menu.show_version_info)
-        
-        created_buttons[8].clicked.disconnect()
-        created_buttons[8].clicked.connect(self.ecg_menu.show_factory_maintain)
-
-        created_buttons[9].clicked.disconnect()
-        created_buttons[9].clicked.connect(self.ecg_menu.show_exit)
+        # One stylesheet for all menu buttons, set once on the container instead of once per button
+        accents = dict.fromkeys(color for _, _, color in menu_buttons)
+        menu_container.setStyleSheet(menu_container.styleSheet() + self.MENU_BUTTON_QSS + "".join(
+            self.MENU_BUTTON_ACCENT_QSS.format(color=color) for color in accents
+        ))
 
         # Recording Toggle Button Section
         recording_frame = QFrame()
@@ -531,8 +1058,10 @@ class ECGTestPage(QWidget):
         
         # Initialize recording variables
         self.is_recording = False
-        self.recording_writer = None
-        self.recording_frames = []
+        self.recording_encoder = None
+        self.recording_thread = None
+        self.recording_path = None  # Temporary file the frames are streamed to until saved or discarded
+        self.recording_frame_count = 0
 
 
         # conn_layout = QHBoxLayout()
@@ -551,6 +1080,7 @@ class ECGTestPage(QWidget):
 
         # Add metrics frame above the plot area
         self.metrics_frame = self.create_metrics_frame()
+        self._metrics_qss = None  # Theme stylesheet last applied by update_metrics_frame_theme
         main_vbox.addWidget(self.metrics_frame)
 
         main_vbox.addWidget(self.plot_area)
@@ -678,49 +1208,110 @@ class ECGTestPage(QWidget):
             
             # Force redraw of all plots
             self.redraw_all_plots()
+            if self._detail_updater:
+                self._detail_updater()
+            if self._overlay_updater:
+                self._overlay_updater()
             
             print(f"Settings applied and titles updated for {key} = {value}")
 
     def update_all_lead_titles(self):
         
-        current_speed = self.settings_manager.get_wave_speed()
-        current_gain = self.settings_manager.get_wave_gain()
-        
-        print(f"Updating titles: Speed={current_speed}mm/s, Gain={current_gain}mm/mV")
+        print(f"Updating titles: Speed={self._wave_speed}mm/s, Gain={self._wave_gain}mm/mV")
         
         for i, lead in enumerate(self.leads):
             if i < len(self.axs):
-                new_title = f"{lead} | Speed: {current_speed}mm/s | Gain: {current_gain}mm/mV"
-                self.axs[i].set_title(new_title, fontsize=8, color='#666', pad=10)
+                new_title = self._title_fmt.format(lead=lead)
+                # Font, colour and pad were set when the layout was built; only the text changes
+                self.axs[i].title.set_text(new_title)
                 print(f"Updated {lead} title: {new_title}")
         
-        # Force redraw of all canvases
-        for canvas in self.canvases:
-            if canvas:
-                canvas.draw_idle()
+        # Titles are static artists, so one full draw bakes them into the blit background
+        if self.canvas:
+            self.canvas.draw_idle()
 
     def apply_display_settings(self):
         
         wave_speed = self.settings_manager.get_wave_speed()
         wave_gain = self.settings_manager.get_wave_gain()
+        # Cached for the draw paths; on_settings_changed re-runs this whenever either setting changes
+        self._wave_speed = wave_speed
+        self._wave_gain = wave_gain
+        self._gain_factor = wave_gain / 10.0  # Trace scale relative to the 10mm/mV baseline
+        self._title_fmt = f"{{lead}} | Speed: {wave_speed}mm/s | Gain: {wave_gain}mm/mV"
         
         # Update buffer size based on wave speed
         # Higher speed = more samples per second = larger buffer for same time window
         base_buffer = 2000
         speed_factor = wave_speed / 50.0  # 50mm/s is baseline
-        self.buffer_size = int(base_buffer * speed_factor)
+        self.resize_buffer(int(base_buffer * speed_factor))
         
         # Update y-axis limits based on gain
         # Higher gain = larger amplitude display
         base_ylim = 400
-        gain_factor = wave_gain / 10.0  # 10mm/mV is baseline
-        self.ylim = int(base_ylim * gain_factor)
+        self.ylim = int(base_ylim * self._gain_factor)
 
         # Force immediate redraw of all plots with new settings
         self.redraw_all_plots()
         
         print(f"Applied settings: speed={wave_speed}mm/s, gain={wave_gain}mm/mV, buffer={self.buffer_size}, ylim={self.ylim}")
 
+    # ------------------------ Lead sample ring buffer ------------------------
+
+    def resize_buffer(self, buffer_size):
+        if buffer_size == self.buffer_size:
+            return
+        # Keep the most recent samples that still fit in the new window
+        self.sync_buffer_views()
+        kept = self._unwrap[:, self.buffer_size - min(self._count, buffer_size):]
+        n = kept.shape[1]
+        self.buffer_size = buffer_size
+        self._buf = np.zeros((len(self.leads), buffer_size), dtype=np.int16)
+        self._buf[:, :n] = kept
+        self._unwrap = np.empty((len(self.leads), buffer_size), dtype=np.float32)
+        self._centered = np.full_like(self._unwrap, np.nan)
+        self._plot_scratch = np.full_like(self._unwrap, np.nan)
+        self._stretch_base = np.linspace(0.0, 1.0, buffer_size, dtype=np.float32)
+        self._overlay_scratch = np.full_like(self._unwrap, np.nan)
+        self._nan_row = np.full(buffer_size, np.nan, dtype=np.float32)
+        self._head = n % buffer_size
+        self._count = n
+        self._sum = kept.sum(axis=1, dtype=np.float64)
+        self.unwrap_buffer()
+        self.center_leads()
+        x = np.arange(buffer_size)
+        for i, line in enumerate(self.lines):
+            line.set_data(x, self._plot_scratch[i])
+        # Open overlay traces follow the new width too (their rows are rewritten on the next overlay update)
+        for line in getattr(self, '_overlay_lines', ()):
+            line.set_data(x, self._nan_row)
+
+    def sync_buffer_views(self):
+        # Unwrap and centre at most once per frame, however many serial batches arrived in between
+        if self._buffer_stale:
+            self.unwrap_buffer()
+            self.center_leads()
+            self._buffer_stale = False
+
+    def unwrap_buffer(self):
+        # Oldest sample first, widened to float32 on the way; until the buffer fills, leading NaNs pad the plot
+        np.concatenate((self._buf[:, self._head:], self._buf[:, :self._head]), axis=1, out=self._unwrap)
+        if self._count < self.buffer_size:
+            self._unwrap[:, :self.buffer_size - self._count] = np.nan
+
+    def center_leads(self):
+        # O(1) means from the sums kept by ingest_sample instead of rescanning the window
+        if self._count:
+            np.subtract(self._unwrap, (self._sum / self._count)[:, None], out=self._centered)
+
+    def get_lead_data(self, lead, centered=False):
+        # Chronological samples received so far for one lead (a view, valid until the next tick)
+        self.sync_buffer_views()
+        source = self._centered if centered else self._unwrap
+        if lead not in self.leads:
+            return source[0, :0]
+        return source[self.leads.index(lead), self.buffer_size - self._count:]
+
     # ------------------------ Update Dashboard Metrics on the top of the lead graphs ------------------------
 
     def create_metrics_frame(self):
@@ -735,7 +1326,8 @@ class ECGTestPage(QWidget):
                 margin: 2px 0;
                 box-shadow: 0 4px 15px rgba(0,0,0,0.1);
             }
-        """)
+        """ + self.METRIC_LABELS_QSS.format(title="#00ff00", heart_rate="#ff0000", pr_interval="#ff0000", qrs_duration="#ffff00",
+                                            qrs_axis="#ffff00", st_segment="#0000ff", time_elapsed="#ffffff"))
         
         metrics_layout = QHBoxLayout(metrics_frame)
         metrics_layout.setSpacing(10)
@@ -743,17 +1335,18 @@ class ECGTestPage(QWidget):
         
         # Store metric labels for live update
         self.metric_labels = {}
+        self._last_metric_text = {}
         
         # Updated metric info to match the image design
         metric_info = [
-            ("PR Intervals (ms)", "--", "pr_interval", "#ff0000"),
-            ("QRS Complex (ms)", "--", "qrs_duration", "#ffff00"),
-            ("QRS Axis", "--", "qrs_axis", "#ffff00"),
-            ("ST Interval", "--", "st_segment", "#0000ff"),
-            ("Time Elapsed", "00:00", "time_elapsed", "#ffffff"),
+            ("PR Intervals (ms)", "--", "pr_interval"),
+            ("QRS Complex (ms)", "--", "qrs_duration"),
+            ("QRS Axis", "--", "qrs_axis"),
+            ("ST Interval", "--", "st_segment"),
+            ("Time Elapsed", "00:00", "time_elapsed"),
         ]
         
-        for title, value, key, color in metric_info:
+        for title, value, key in metric_info:
             metric_widget = QWidget()
             metric_widget.setStyleSheet("""
                 QWidget {
@@ -770,14 +1363,14 @@ class ECGTestPage(QWidget):
             
             # Title label (green color as shown in image)
             lbl = QLabel(title)
-            lbl.setFont(QFont("Arial", 12, QFont.Bold))
-            lbl.setStyleSheet("color: #00ff00; margin-bottom: 5px;")  # Green color
+            lbl.setObjectName("metric_title")
+            lbl.setFont(cached_font("Arial", 12, QFont.Bold))
             lbl.setAlignment(Qt.AlignCenter)
             
-            # Value label with specific colors
+            # Value label, coloured per metric by the frame stylesheet
             val = QLabel(value)
-            val.setFont(QFont("Arial", 14, QFont.Bold))
-            val.setStyleSheet(f"color: {color}; background: transparent; padding: 4px 0px;")
+            val.setObjectName(f"{key}_value")
+            val.setFont(cached_font("Arial", 14, QFont.Bold))
             val.setAlignment(Qt.AlignCenter)
             
             # Add labels to the metric widget's layout
@@ -806,14 +1399,14 @@ class ECGTestPage(QWidget):
         
         # Heart icon
         heart_icon = QLabel("❤")
-        heart_icon.setFont(QFont("Arial", 18))
+        heart_icon.setFont(cached_font("Arial", 18))
         heart_icon.setStyleSheet("color: #ff0000; background: transparent; border: none; margin: 0; padding: 0;")
         heart_icon.setAlignment(Qt.AlignCenter)
         
         # Heart rate value
         heart_rate_val = QLabel("00")
-        heart_rate_val.setFont(QFont("Arial", 14, QFont.Bold))
-        heart_rate_val.setStyleSheet("color: #ff0000; background: transparent; border: none; margin: 0;")
+        heart_rate_val.setObjectName("heart_rate_value")
+        heart_rate_val.setFont(cached_font("Arial", 14, QFont.Bold))
         heart_rate_val.setAlignment(Qt.AlignCenter)
         heart_rate_val.setContentsMargins(0, 0, 0, 0)
         
@@ -827,140 +1420,39 @@ class ECGTestPage(QWidget):
         return metrics_frame
 
     def update_ecg_metrics_on_top_of_lead_graphs(self, intervals):
-        if 'Heart_Rate' in intervals and intervals['Heart_Rate'] is not None:
-            self.metric_labels['heart_rate'].setText(
-                f"{int(round(intervals['Heart_Rate']))}" if isinstance(intervals['Heart_Rate'], (int, float)) else str(intervals['Heart_Rate'])
-            )
-        
-        if 'PR' in intervals and intervals['PR'] is not None:
-            self.metric_labels['pr_interval'].setText(
-                f"{int(round(intervals['PR']))}" if isinstance(intervals['PR'], (int, float)) else str(intervals['PR'])
-            )
-        
-        if 'QRS' in intervals and intervals['QRS'] is not None:
-            self.metric_labels['qrs_duration'].setText(
-                f"{int(round(intervals['QRS']))}" if isinstance(intervals['QRS'], (int, float)) else str(intervals['QRS'])
-            )
-        
-        if 'QRS_axis' in intervals and intervals['QRS_axis'] is not None:
-            self.metric_labels['qrs_axis'].setText(str(intervals['QRS_axis']))
-        
-        if 'ST' in intervals and intervals['ST'] is not None:
-            self.metric_labels['st_segment'].setText(
-                f"{int(round(intervals['ST']))}" if isinstance(intervals['ST'], (int, float)) else str(intervals['ST'])
-            )
-        
-        if 'time_elapsed' in self.metric_labels:
-            # Time elapsed will be updated separately by a timer
-            pass
+        for key, label_key in self.METRIC_KEYS:
+            value = intervals.get(key)
+            if value is not None:
+                self.set_metric_text(label_key, _format_metric(value))
+        axis = intervals.get('QRS_axis')
+        if axis is not None:
+            self.set_metric_text('qrs_axis', str(axis))
+        # time_elapsed is driven separately by update_elapsed_time
+
+    def set_metric_text(self, key, text):
+        # setText relayouts and repaints the label even for an identical string, so skip unchanged values
+        if self._last_metric_text.get(key) != text:
+            self.metric_labels[key].setText(text)
+            self._last_metric_text[key] = text
 
     def update_metrics_frame_theme(self, dark_mode=False, medical_mode=False):
        
         if not hasattr(self, 'metrics_frame'):
             return
-            
+
         if dark_mode:
-            # Dark mode styling
-            self.metrics_frame.setStyleSheet("""
-                QFrame#metrics_frame {
-                    background: #000000;
-                    border: 2px solid #333333;
-                    border-radius: 6px;
-                    padding: 4px;
-                    margin: 2px 0;
-                    box-shadow: 0 4px 15px rgba(0,0,0,0.3);
-                }
-            """)
-            
-            # Update text colors for dark mode
-            for key, label in self.metric_labels.items():
-                if key == 'heart_rate':
-                    label.setStyleSheet("color: #ff0000; background: transparent; padding: 0; border: none; margin: 0;")
-                elif key == 'pr_interval':
-                    label.setStyleSheet("color: #ff0000; background: transparent; padding: 4px 0px; border: none;")
-                elif key == 'qrs_duration':
-                    label.setStyleSheet("color: #ffff00; background: transparent; padding: 4px 0px; border: none;")
-                elif key == 'qrs_axis':
-                    label.setStyleSheet("color: #ffff00; background: transparent; padding: 4px 0px; border: none;")
-                elif key == 'st_segment':
-                    label.setStyleSheet("color: #0000ff; background: transparent; padding: 4px 0px; border: none;")
-                elif key == 'time_elapsed':
-                    label.setStyleSheet("color: #ffffff; background: transparent; padding: 4px 0px; border: none;")
-            
-            # Update title colors to green for dark mode
-            for child in self.metrics_frame.findChildren(QLabel):
-                if child != self.metric_labels.get('heart_rate') and child != self.metric_labels.get('time_elapsed'):
-                    if not any(child == label for label in self.metric_labels.values()):
-                        child.setStyleSheet("color: #00ff00; margin-bottom: 5px; border: none;")
-                        
+            qss = self.METRICS_QSS_DARK
         elif medical_mode:
             # Medical mode styling (green theme)
-            self.metrics_frame.setStyleSheet("""
-                QFrame#metrics_frame {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                        stop:0 #f0fff0, stop:1 #e0f0e0);
-                    border: 2px solid #4CAF50;
-                    border-radius: 6px;
-                    padding: 4px;
-                    margin: 2px 0;
-                    box-shadow: 0 4px 15px rgba(76,175,80,0.2);
-                }
-            """)
-            
-            # Update text colors for medical mode
-            for key, label in self.metric_labels.items():
-                if key == 'heart_rate':
-                    label.setStyleSheet("color: #d32f2f; background: transparent; padding: 0; border: none; margin: 0;")
-                elif key == 'pr_interval':
-                    label.setStyleSheet("color: #d32f2f; background: transparent; padding: 4px 0px; border: none;")
-                elif key == 'qrs_duration':
-                    label.setStyleSheet("color: #f57c00; background: transparent; padding: 4px 0px; border: none;")
-                elif key == 'qrs_axis':
-                    label.setStyleSheet("color: #f57c00; background: transparent; padding: 4px 0px; border: none;")
-                elif key == 'st_segment':
-                    label.setStyleSheet("color: #1976d2; background: transparent; padding: 4px 0px; border: none;")
-                elif key == 'time_elapsed':
-                    label.setStyleSheet("color: #388e3c; background: transparent; padding: 4px 0px; border: none;")
-            
-            # Update title colors to dark green for medical mode
-            for child in self.metrics_frame.findChildren(QLabel):
-                if child != self.metric_labels.get('heart_rate') and child != self.metric_labels.get('time_elapsed'):
-                    if not any(child == label for label in self.metric_labels.values()):
-                        child.setStyleSheet("color: #2e7d32; margin-bottom: 5px; border: none;")
-                        
+            qss = self.METRICS_QSS_MEDICAL
         else:
             # Light mode (default) styling
-            self.metrics_frame.setStyleSheet("""
-                QFrame#metrics_frame {
-                    background: #ffffff;
-                    border: 2px solid #e0e0e0;
-                    border-radius: 6px;
-                    padding: 4px;
-                    margin: 2px 0;
-                    box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-                }
-            """)
-            
-            # Update text colors for light mode
-            for key, label in self.metric_labels.items():
-                if key == 'heart_rate':
-                    label.setStyleSheet("color: #ff0000; background: transparent; padding: 0; border: none; margin: 0;")
-                elif key == 'pr_interval':
-                    label.setStyleSheet("color: #ff0000; background: transparent; padding: 4px 0px; border: none;")
-                elif key == 'qrs_duration':
-                    label.setStyleSheet("color: #ff8f00; background: transparent; padding: 4px 0px; border: none;")
-                elif key == 'qrs_axis':
-                    label.setStyleSheet("color: #ff8f00; background: transparent; padding: 4px 0px; border: none;")
-                elif key == 'st_segment':
-                    label.setStyleSheet("color: #1976d2; background: transparent; padding: 4px 0px; border: none;")
-                elif key == 'time_elapsed':
-                    label.setStyleSheet("color: #424242; background: transparent; padding: 4px 0px; border: none;")
-            
-            # Update title colors to dark gray for light mode
-            for child in self.metrics_frame.findChildren(QLabel):
-                if child != self.metric_labels.get('heart_rate') and child != self.metric_labels.get('time_elapsed'):
-                    if not any(child == label for label in self.metric_labels.values()):
-                        child.setStyleSheet("color: #666; margin-bottom: 5px; border: none;")
+            qss = self.METRICS_QSS_LIGHT
+        # The dashboard re-sends the theme on several events; re-applying the same sheet would only re-polish the frame
+        if qss is self._metrics_qss:
+            return
+        self._metrics_qss = qss
+        self.metrics_frame.setStyleSheet(qss)
 
     def update_elapsed_time(self):
         
@@ -968,30 +1460,28 @@ class ECGTestPage(QWidget):
             elapsed = time.time() - self.start_time
             minutes = int(elapsed // 60)
             seconds = int(elapsed % 60)
-            self.metric_labels['time_elapsed'].setText(f"{minutes:02d}:{seconds:02d}")
+            self.set_metric_text('time_elapsed', f"{minutes:02d}:{seconds:02d}")
 
     # ------------------------ Calculate ECG Intervals ------------------------
 
     def calculate_ecg_intervals(self, lead_ii_data):
-        if not lead_ii_data or len(lead_ii_data) < 100:
+        if len(lead_ii_data) < 100:
             return {}
         
         try:
-            from ecg.pan_tompkins import pan_tompkins
-            
-            # Convert to numpy array
-            data = np.array(lead_ii_data)
+            # Runs on the thread pool: update_live_metrics passes a float32 copy of the Lead II window,
+            # taken on the GUI thread before submitting, so this never aliases the live ring buffer
+            data = np.asarray(lead_ii_data)
+            fs = 500  # Sampling rate (Hz)
             
             # Detect R peaks using Pan-Tompkins algorithm
-            r_peaks = pan_tompkins(data, fs=500)  # 500Hz sampling rate
+            r_peaks = pan_tompkins(data, fs=fs)
             
             if len(r_peaks) < 2:
                 return {}
             
-            # Calculate heart rate
-            rr_intervals = np.diff(r_peaks) / 500.0  # Convert to seconds
-            mean_rr = np.mean(rr_intervals)
-            heart_rate = 60 / mean_rr if mean_rr > 0 else 0
+            # Calculate heart rate from the mean RR interval; peaks are strictly increasing
+            heart_rate = 60.0 * fs / np.diff(r_peaks).mean()
             
             # Calculate intervals
             pr_interval = 0.16  
@@ -1063,19 +1553,9 @@ class ECGTestPage(QWidget):
                 )
                 
                 if filename:
-                    # Save the screenshot
-                    if pixmap.save(filename):
-                        QMessageBox.information(
-                            self, 
-                            "Success", 
-                            f"Screenshot saved successfully!\nLocation: {filename}"
-                        )
-                    else:
-                        QMessageBox.warning(
-                            self, 
-                            "Error", 
-                            "Failed to save screenshot."
-                        )
+                    # Encode on the thread pool; QImage (unlike QPixmap) may be used off the GUI thread
+                    image = pixmap.toImage()
+                    QThreadPool.globalInstance().start(lambda: self._save_screenshot(image, filename))
             
             # Use a short delay to ensure the UI is fully rendered
             QTimer.singleShot(100, delayed_capture)
@@ -1087,6 +1567,28 @@ class ECGTestPage(QWidget):
                 f"Failed to capture screenshot: {str(e)}"
             )
 
+    def _save_screenshot(self, image, filename):
+        # Runs on a pool thread. Naming the format skips Qt's plugin lookup by file extension
+        if filename.lower().endswith(('.jpg', '.jpeg')):
+            saved = image.save(filename, "JPG", 90)
+        else:
+            saved = image.save(filename, "PNG")
+        self.screenshot_saved.emit(filename, saved)
+
+    def _report_screenshot(self, filename, saved):
+        if saved:
+            QMessageBox.information(
+                self, 
+                "Success", 
+                f"Screenshot saved successfully!\nLocation: {filename}"
+            )
+        else:
+            QMessageBox.warning(
+                self, 
+                "Error", 
+                "Failed to save screenshot."
+            )
+
     # ------------------------ Recording Details ------------------------
 
     def toggle_recording(self):
@@ -1097,16 +1599,24 @@ class ECGTestPage(QWidget):
     
     def start_recording(self):
         try:
-            # Initialize recording
+            # Initialize recording; the writer is opened on the first frame, once the frame size is known
+            fd, self.recording_path = tempfile.mkstemp(prefix="ecg_recording_", suffix=".mp4")
+            os.close(fd)
+            self.recording_frame_count = 0
+            self.recording_thread = QThread()
+            self.recording_encoder = FrameEncoder(self.recording_path)
+            self.recording_encoder.moveToThread(self.recording_thread)
+            self.recording_thread.started.connect(self.recording_encoder.run)
+            self.recording_thread.start()
             self.is_recording = True
             
             # Update UI - only change button text, no status updates
             self.recording_toggle.setText("STOP")
             
-            # Start capture timer
-            self.recording_timer = QTimer()
-            self.recording_timer.timeout.connect(self.capture_frame)
-            self.recording_timer.start(33)  # ~30 FPS
+            # Frames are captured from the shared frame timer; start it if acquisition isn't running it already
+            if not self.draw_timer.isActive():
+                self._frame_cost = 0.0
+                self.draw_timer.start(self.FRAME_INTERVAL_MS)
             
         except Exception as e:
             QMessageBox.warning(self, "Recording Error", f"Failed to start recording: {str(e)}")
@@ -1117,14 +1627,22 @@ class ECGTestPage(QWidget):
         try:
             # Stop recording
             self.is_recording = False
-            if hasattr(self, 'recording_timer'):
-                self.recording_timer.stop()
+            if self.serial_thread is None:
+                self.draw_timer.stop()
+            if self.recording_thread is not None:
+                # Let the encoder drain its queue and close the file
+                self.recording_encoder.finish()
+                self.recording_thread.quit()
+                self.recording_thread.wait()
+                self.recording_frame_count = self.recording_encoder.frame_count
+                self.recording_thread = None
+                self.recording_encoder = None
             
             # Update UI - only change button text, no status updates
             self.recording_toggle.setText("RECORD")
             
             # Ask user if they want to save the recording
-            if len(self.recording_frames) > 0:
+            if self.recording_frame_count > 0:
                 reply = QMessageBox.question(
                     self, 
                     "Save Recording", 
@@ -1137,8 +1655,10 @@ class ECGTestPage(QWidget):
                     self.save_recording()
                 else:
                     # Discard recording
-                    self.recording_frames.clear()
+                    self.discard_recording()
                     QMessageBox.information(self, "Recording Discarded", "Recording has been discarded.")
+            else:
+                self.discard_recording()
             
         except Exception as e:
             QMessageBox.warning(self, "Recording Error", f"Failed to stop recording: {str(e)}")
@@ -1151,24 +1671,28 @@ class ECGTestPage(QWidget):
                 screen = QApplication.primaryScreen()
                 pixmap = screen.grabWindow(self.winId())
                 
-                # Convert to numpy array for OpenCV
-                image = pixmap.toImage()
+                # Convert to numpy array for OpenCV; RGB32 is stored as B, G, R, X bytes (usually a no-op convert)
+                image = pixmap.toImage().convertToFormat(QImage.Format_RGB32)
                 width = image.width()
                 height = image.height()
-                ptr = image.bits()
-                ptr.setsize(height * width * 4)
-                arr = np.frombuffer(ptr, np.uint8).reshape((height, width, 4))
-                arr = cv2.cvtColor(arr, cv2.COLOR_RGBA2BGR)
+                stride = image.bytesPerLine()
+                # constBits gives read-only access, so Qt doesn't detach (copy) the image data as bits() may
+                ptr = image.constBits()
+                ptr.setsize(height * stride)
+                # Rows can be padded past width * 4 bytes, so reshape by stride and crop
+                arr = np.frombuffer(ptr, np.uint8).reshape((height, stride // 4, 4))[:, :width]
+                import cv2  # Deferred: OpenCV is only needed while recording
+                arr = cv2.cvtColor(arr, cv2.COLOR_BGRA2BGR)
                 
-                # Store frame
-                self.recording_frames.append(arr)
+                # Encoded and written to disk by the encoder thread
+                self.recording_encoder.submit(arr)
                 
         except Exception as e:
             print(f"Frame capture error: {e}")
     
     def save_recording(self):
         try:
-            if len(self.recording_frames) == 0:
+            if self.recording_frame_count == 0:
                 QMessageBox.warning(self, "No Recording", "No frames to save.")
                 return
             
@@ -1184,21 +1708,10 @@ class ECGTestPage(QWidget):
             )
             
             if file_path:
-                # Get video dimensions from first frame
-                height, width = self.recording_frames[0].shape[:2]
-                
-                # Create video writer
-                fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-                out = cv2.VideoWriter(file_path, fourcc, 30.0, (width, height))
-                
-                # Write frames
-                for frame in self.recording_frames:
-                    out.write(frame)
-                
-                out.release()
-                
-                # Clear frames
-                self.recording_frames.clear()
+                # The video was already encoded while recording; just move it into place
+                shutil.move(self.recording_path, file_path)
+                self.recording_path = None
+                self.recording_frame_count = 0
                 
                 QMessageBox.information(
                     self, 
@@ -1207,12 +1720,18 @@ class ECGTestPage(QWidget):
                 )
             else:
                 # User cancelled save
-                self.recording_frames.clear()
+                self.discard_recording()
                 QMessageBox.information(self, "Recording Cancelled", "Recording was not saved.")
                 
         except Exception as e:
             QMessageBox.warning(self, "Save Error", f"Failed to save recording: {str(e)}")
-            self.recording_frames.clear()
+            self.discard_recording()
+
+    def discard_recording(self):
+        if self.recording_path and os.path.exists(self.recording_path):
+            os.remove(self.recording_path)
+        self.recording_path = None
+        self.recording_frame_count = 0
 
     # ------------------------ Get lead figure in pdf ------------------------
 
@@ -1220,38 +1739,41 @@ class ECGTestPage(QWidget):
         if hasattr(self, "lead_figures"):
             return self.lead_figures.get(lead)
 
-        ordered_leads = ["I", "II", "III", "aVR", "aVL", "aVF", "V1", "V2", "V3", "V4", "V5", "V6"]
-        if hasattr(self, "figures"):
-            if lead in ordered_leads:
-                idx = ordered_leads.index(lead)
-                if idx < len(self.figures):
-                    return self.figures[idx]
-        return None
+        # The live grid shares one figure, so the report gets a standalone copy of the lead's trace
+        if lead not in self.leads or not self.lines:
+            return None
+        idx = self.leads.index(lead)
+        live_ax = self.axs[idx]
+        live_line = self.lines[idx]
+        fig = Figure(facecolor='#fafbfc', figsize=(6, 2.5))
+        ax = fig.add_subplot(111)
+        ax.set_facecolor('#fafbfc')
+        ax.set_xlim(live_ax.get_xlim())
+        ax.set_ylim(live_ax.get_ylim())
+        ax.plot(live_line.get_xdata(), live_line.get_ydata(), color=live_line.get_color(), lw=0.5)
+        return fig
 
     def center_on_screen(self):
         qr = self.frameGeometry()
-        from PyQt5.QtWidgets import QApplication
         cp = QApplication.desktop().availableGeometry().center()
         qr.moveCenter(cp)
         self.move(qr.topLeft())
 
     def expand_lead(self, idx):
         lead = self.leads[idx]
-        def get_lead_data():
-            return self.data[lead]
-        color = self.LEAD_COLORS.get(lead, "#00ff99")
-        if hasattr(self, '_detailed_timer') and self._detailed_timer is not None:
-            self._detailed_timer.stop()
-            self._detailed_timer.deleteLater()
-            self._detailed_timer = None
-        old_layout = self.detailed_widget.layout()
-        if old_layout is not None:
-            while old_layout.count():
-                item = old_layout.takeAt(0)
-                widget = item.widget()
-                if widget is not None:
-                    widget.deleteLater()
-            QWidget().setLayout(old_layout)
+        if self._detail_canvas is None:
+            self.build_detailed_view()
+        # The detailed view is built once and pointed at the clicked lead
+        self._detail_lead = lead
+        self._pqrst_cache = None
+        self._axis_st = None
+        self._detail_line.set_data([], [])
+        self._detail_line.set_color(self._lead_rgba[idx])
+        self.page_stack.setCurrentIndex(1)
+        self._detail_updater = self.update_detailed_plot
+        self.update_detailed_plot()  # Draw immediately on open
+
+    def build_detailed_view(self):
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
@@ -1262,8 +1784,22 @@ class ECGTestPage(QWidget):
         fig = Figure(facecolor='#fff')  # White background for the figure
         ax = fig.add_subplot(111)
         ax.set_facecolor('#fff')        # White background for the axes
-        line, = ax.plot([], [], color=color, lw=2)
+        # The trace and the PQRST markers are persistent animated artists, blitted over the cached axes
+        line, = ax.plot([], [], lw=2, animated=True)
+        self._pqrst_markers = {}
+        self._pqrst_texts = {}
+        for label in "PQRST":
+            self._pqrst_markers[label], = ax.plot([], [], 'o', color='green', markersize=8, zorder=10, animated=True)
+            self._pqrst_texts[label] = ax.text(0, 0, label, color='green', fontsize=12, fontweight='bold', ha='center',
+                                               va='bottom' if label in "PT" else 'top', zorder=11, animated=True, visible=False,
+                                               bbox=dict(facecolor='white', edgecolor='none', alpha=0.7, boxstyle='round,pad=0.1'))
         canvas = FigureCanvas(fig)
+        # As with the lead grid, the Agg buffer covers the whole widget, so Qt need not clear it first
+        canvas.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        canvas.setAttribute(Qt.WA_NoSystemBackground, True)
+        self._detail_background = None
+        self._detail_width_px = 0  # Axes width in device pixels, refreshed on every full draw (e.g. resize)
+        canvas.mpl_connect('draw_event', self._cache_detail_background)
         canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         layout.addWidget(canvas)
         # Create metric labels for cards
@@ -1305,182 +1841,190 @@ class ECGTestPage(QWidget):
         layout.addLayout(metrics_row)
         self.detailed_widget.setLayout(layout)
         self.detailed_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.page_stack.setCurrentIndex(1)
-        self._detailed_timer = QTimer(self)
-
-        def update_detailed_plot():
-            detailed_buffer_size = 500  # Reduced to 500 samples for real-time effect
-            data = get_lead_data()
+        self._detail_ax = ax
+        self._detail_line = line
+        self._detail_canvas = canvas
+        self._detail_labels = (pr_label, qrs_label, qtc_label, arrhythmia_label)
+
+    def _cache_detail_background(self, event=None):
+        self._detail_background = self._detail_canvas.copy_from_bbox(self._detail_canvas.figure.bbox)
+        self._detail_width_px = int(self._detail_ax.bbox.width)
+        self._draw_detail_artists()
+
+    def _draw_detail_artists(self):
+        ax = self._detail_ax
+        ax.draw_artist(self._detail_line)
+        for label in "PQRST":
+            if self._pqrst_markers[label].get_visible():
+                ax.draw_artist(self._pqrst_markers[label])
+                ax.draw_artist(self._pqrst_texts[label])
+
+    def _set_detail_limits(self, xlim, ylim):
+        # Returns whether the limits moved, i.e. whether the cached background is stale
+        ax = self._detail_ax
+        if ax.get_xlim() == xlim and ax.get_ylim() == ylim:
+            return False
+        ax.set_xlim(*xlim)
+        ax.set_ylim(*ylim)
+        return True
+
+    def update_detailed_plot(self):
+        lead = self._detail_lead
+        line, canvas = self._detail_line, self._detail_canvas
+        pr_label, qrs_label, qtc_label, arrhythmia_label = self._detail_labels
+        detailed_buffer_size = 500  # Reduced to 500 samples for real-time effect
+        data = self.get_lead_data(lead, centered=True)
+
+        # Robust: Only plot if enough data, else show blank
+        if len(data) >= 10:
+            # Apply current gain setting
+            gain_factor = self._gain_factor
+            centered = data[-detailed_buffer_size:] * gain_factor
+            x = np.arange(len(centered))
+
+            # More than two samples per pixel column only adds vertices to stroke; thin the trace by stride
+            width_px = self._detail_width_px
+            if width_px and len(centered) > 2 * width_px:
+                step = len(centered) // width_px
+                line.set_data(x[::step], centered[::step])
+            else:
+                line.set_data(x, centered)
+            
+            ylim = 500 * gain_factor
+            ymin = np.min(centered) - ylim * 0.2
+            ymax = np.max(centered) + ylim * 0.2
+            if ymin == ymax:
+                ymin, ymax = -ylim, ylim
+            # Snapped outwards to 20% of the gain range so the limits (and cached background) rarely change
+            step = ylim * 0.2
+            limits_changed = self._set_detail_limits((0, max(len(centered)-1, 1)),
+                                                     (np.floor(ymin / step) * step, np.ceil(ymax / step) * step))
+
+            # --- PQRST detection and green labeling for Lead II only ---
+            for label in "PQRST":
+                self._pqrst_markers[label].set_visible(False)
+                self._pqrst_texts[label].set_visible(False)
+            if lead == "II":
+                # Use the same detection logic as in main.py
+                sampling_rate = 80
+                ecg_signal = centered
+                window_size = min(500, len(ecg_signal))
+                if len(ecg_signal) > window_size:
+                    ecg_signal = ecg_signal[-window_size:]
+                    x = x[-window_size:]
+                end = self._samples_in
+                start = end - len(ecg_signal)  # Absolute index of the window's first sample
+                cache = self._pqrst_cache
+                if cache is None or end - cache[0] >= self.PQRST_MIN_NEW_SAMPLES:
+                    peaks = detect_pqrst(ecg_signal, sampling_rate)
+                    self._pqrst_cache = (end, tuple(np.asarray(idxs, dtype=np.intp) + start for idxs in peaks))
+                else:
+                    # Too few new samples to move any peak; slide the previous ones along with the window
+                    peaks = tuple(idxs[idxs >= start] - start for idxs in cache[1])
+                p_peaks, q_peaks, r_peaks, s_peaks, t_peaks = peaks
+                # Only show the most recent peak for each label (if any)
+                peak_dict = {'P': p_peaks, 'Q': q_peaks, 'R': r_peaks, 'S': s_peaks, 'T': t_peaks}
+                y_offset = 0.12 * (np.max(ecg_signal) - np.min(ecg_signal))
+                for label, idxs in peak_dict.items():
+                    if len(idxs) > 0:
+                        idx = idxs[-1]
+                        y = ecg_signal[idx]
+                        self._pqrst_markers[label].set_data([idx], [y])
+                        self._pqrst_markers[label].set_visible(True)
+                        text = self._pqrst_texts[label]
+                        text.set_position((idx, y + y_offset if label in "PT" else y - y_offset))
+                        text.set_visible(True)
+            # --- Metrics (for Lead II only, based on R peaks) ---
+            if lead == "II":
+                heart_rate = None
+                pr_interval = None
+                qrs_duration = None
+                qt_interval = None
+                qtc_interval = None
+                rr_intervals = None
+
+                ms_per_sample = 1000.0 / sampling_rate
+                if len(r_peaks) > 1:
+                    rr_samples = np.diff(r_peaks)
+                    rr_intervals = rr_samples / sampling_rate  # in seconds, for the rhythm classifier
+                    mean_rr = rr_samples.mean()  # in samples; heart rate needs no per-element divide
+                    if mean_rr > 0:
+                        heart_rate = 60.0 * sampling_rate / mean_rr
+                if len(p_peaks) > 0 and len(r_peaks) > 0:
+                    pr_interval = (r_peaks[-1] - p_peaks[-1]) * ms_per_sample
+                if len(q_peaks) > 0 and len(s_peaks) > 0:
+                    qrs_duration = (s_peaks[-1] - q_peaks[-1]) * ms_per_sample
+                if len(q_peaks) > 0 and len(t_peaks) > 0:
+                    qt_interval = (t_peaks[-1] - q_peaks[-1]) * ms_per_sample
+                if qt_interval and heart_rate:
+                    qtc_interval = qt_interval / np.sqrt(60 / heart_rate)  # Bazett's formula
 
-            current_gain = self.settings_manager.get_wave_gain()
-            current_speed = self.settings_manager.get_wave_speed()
+                # Update ECG metrics labels with calculated values for Lead2 graph
 
-            # Robust: Only plot if enough data, else show blank
-            if data and len(data) >= 10:
-                plot_data = np.array(data[-detailed_buffer_size:])
-                x = np.arange(len(plot_data))
-                centered = plot_data - np.mean(plot_data)
+                if isinstance(pr_interval, (int, float)):
+                    pr_label.setText(f"{int(round(pr_interval))} ms")
+                else:
+                    pr_label.setText("-- ms")
 
-                # Apply current gain setting
-                gain_factor = float(current_gain) / 10.0
-                centered = centered * gain_factor
+                if isinstance(qrs_duration, (int, float)):
+                    qrs_label.setText(f"{int(round(qrs_duration))} ms")
+                else:
+                    qrs_label.setText("-- ms")
 
-                line.set_data(x, centered)
-                ax.set_xlim(0, max(len(centered)-1, 1))
+                if isinstance(qtc_interval, (int, float)) and qtc_interval >= 0:
+                    qtc_label.setText(f"{int(round(qtc_interval))} ms")
+                else:
+                    qtc_label.setText("-- ms")
                 
-                ylim = 500 * gain_factor
-                ymin = np.min(centered) - ylim * 0.2
-                ymax = np.max(centered) + ylim * 0.2
-                if ymin == ymax:
-                    ymin, ymax = -ylim, ylim
-                ax.set_ylim(ymin, ymax)
-
-                # --- PQRST detection and green labeling for Lead II only ---
-                # Remove all extra lines except the main ECG line (robust for all Matplotlib versions)
-                try:
-                    while len(ax.lines) > 1:
-                        ax.lines.remove(ax.lines[-1])
-                except Exception as e:
-                    print(f"Warning: Could not remove extra lines: {e}")
-                for txt in list(ax.texts):
-                    try:
-                        txt.remove()
-                    except Exception as e:
-                        print(f"Warning: Could not remove text: {e}")
-                # Optionally, clear all lines if you want only labels visible (no ECG trace):
-                # ax.lines.clear()
-                if lead == "II":
-                    # Use the same detection logic as in main.py
-                    from scipy.signal import find_peaks
-                    sampling_rate = 80
-                    ecg_signal = centered
-                    window_size = min(500, len(ecg_signal))
-                    if len(ecg_signal) > window_size:
-                        ecg_signal = ecg_signal[-window_size:]
-                        x = x[-window_size:]
-                    # R peak detection
-                    r_peaks, _ = find_peaks(ecg_signal, distance=int(0.2 * sampling_rate), prominence=0.6 * np.std(ecg_signal))
-                    # Q and S: local minima before and after R
-                    q_peaks = []
-                    s_peaks = []
-                    for r in r_peaks:
-                        q_start = max(0, r - int(0.06 * sampling_rate))
-                        q_end = r
-                        if q_end > q_start:
-                            q_idx = np.argmin(ecg_signal[q_start:q_end]) + q_start
-                            q_peaks.append(q_idx)
-                        s_start = r
-                        s_end = min(len(ecg_signal), r + int(0.06 * sampling_rate))
-                        if s_end > s_start:
-                            s_idx = np.argmin(ecg_signal[s_start:s_end]) + s_start
-                            s_peaks.append(s_idx)
-                    # P: positive peak before Q (within 0.1-0.2s)
-                    p_peaks = []
-                    for q in q_peaks:
-                        p_start = max(0, q - int(0.2 * sampling_rate))
-                        p_end = q - int(0.08 * sampling_rate)
-                        if p_end > p_start:
-                            p_candidates, _ = find_peaks(ecg_signal[p_start:p_end], prominence=0.1 * np.std(ecg_signal))
-                            if len(p_candidates) > 0:
-                                p_peaks.append(p_start + p_candidates[-1])
-                    # T: positive peak after S (within 0.1-0.4s)
-                    t_peaks = []
-                    for s in s_peaks:
-                        t_start = s + int(0.08 * sampling_rate)
-                        t_end = min(len(ecg_signal), s + int(0.4 * sampling_rate))
-                        if t_end > t_start:
-                            t_candidates, _ = find_peaks(ecg_signal[t_start:t_end], prominence=0.1 * np.std(ecg_signal))
-                            if len(t_candidates) > 0:
-                                t_peaks.append(t_start + t_candidates[np.argmax(ecg_signal[t_start + t_candidates])])
-                    # Only show the most recent peak for each label (if any)
-                    peak_dict = {'P': p_peaks, 'Q': q_peaks, 'R': r_peaks, 'S': s_peaks, 'T': t_peaks}
-                    for label, idxs in peak_dict.items():
-                        if len(idxs) > 0:
-                            idx = idxs[-1]
-                            ax.plot(idx, ecg_signal[idx], 'o', color='green', markersize=8, zorder=10)
-                            y_offset = 0.12 * (np.max(ecg_signal) - np.min(ecg_signal))
-                            if label in ['P', 'T']:
-                                ax.text(idx, ecg_signal[idx]+y_offset, label, color='green', fontsize=12, fontweight='bold', ha='center', va='bottom', zorder=11, bbox=dict(facecolor='white', edgecolor='none', alpha=0.7, boxstyle='round,pad=0.1'))
-                            else:
-                                ax.text(idx, ecg_signal[idx]-y_offset, label, color='green', fontsize=12, fontweight='bold', ha='center', va='top', zorder=11, bbox=dict(facecolor='white', edgecolor='none', alpha=0.7, boxstyle='round,pad=0.1'))
-                # --- Metrics (for Lead II only, based on R peaks) ---
-                if lead == "II":
-                    heart_rate = None
-                    pr_interval = None
-                    qrs_duration = None
-                    qt_interval = None
-                    qtc_interval = None
-                    rr_intervals = None
-
-                    if len(r_peaks) > 1:
-                        rr_intervals = np.diff(r_peaks) / sampling_rate  # in seconds
-                        mean_rr = np.mean(rr_intervals)
-                        if mean_rr > 0:
-                            heart_rate = 60 / mean_rr
-                    if len(p_peaks) > 0 and len(r_peaks) > 0:
-                        pr_interval = (r_peaks[-1] - p_peaks[-1]) * 1000 / sampling_rate  # ms
-                    if len(q_peaks) > 0 and len(s_peaks) > 0:
-                        qrs_duration = (s_peaks[-1] - q_peaks[-1]) * 1000 / sampling_rate  # ms
-                    if len(q_peaks) > 0 and len(t_peaks) > 0:
-                        qt_interval = (t_peaks[-1] - q_peaks[-1]) * 1000 / sampling_rate  # ms
-                    if qt_interval and heart_rate:
-                        qtc_interval = qt_interval / np.sqrt(60 / heart_rate)  # Bazett's formula
-
-                    # Update ECG metrics labels with calculated values for Lead2 graph
-
-                    if isinstance(pr_interval, (int, float)):
-                        pr_label.setText(f"{int(round(pr_interval))} ms")
-                    else:
-                        pr_label.setText("-- ms")
-
-                    if isinstance(qrs_duration, (int, float)):
-                        qrs_label.setText(f"{int(round(qrs_duration))} ms")
-                    else:
-                        qrs_label.setText("-- ms")
-
-                    if isinstance(qtc_interval, (int, float)) and qtc_interval >= 0:
-                        qtc_label.setText(f"{int(round(qtc_interval))} ms")
-                    else:
-                        qtc_label.setText("-- ms")
-                    
+                # QRS axis and ST level drift slowly; refresh them every AXIS_ST_INTERVAL_S, not every frame
+                now = time.perf_counter()
+                if self._axis_st is None or now - self._axis_st_time >= self.AXIS_ST_INTERVAL_S:
                     # Calculate QRS axis using Lead I and aVF
-                    lead_I = self.data.get("I", [])
-                    lead_aVF = self.data.get("aVF", [])
+                    lead_I = self.get_lead_data("I")
+                    lead_aVF = self.get_lead_data("aVF")
                     qrs_axis = calculate_qrs_axis(lead_I, lead_aVF, r_peaks)
 
                     # Calculate ST segment using Lead II and r_peaks
-                    lead_ii = self.data.get("II", [])
+                    lead_ii = self.get_lead_data("II")
                     st_segment = calculate_st_segment(lead_ii, r_peaks, fs=500)
-
-                    if hasattr(self, 'dashboard_callback'):
-                        self.dashboard_callback({
-                            'Heart_Rate': heart_rate,
-                            'PR': pr_interval,
-                            'QRS': qrs_duration,
-                            'QTc': qtc_interval,
-                            'QRS_axis': qrs_axis,
-                            'ST': st_segment
-                        })
-
-                    # --- Arrhythmia detection ---
-                    arrhythmia_result = detect_arrhythmia(heart_rate, qrs_duration, rr_intervals)
-                    arrhythmia_label.setText(arrhythmia_result)
+                    self._axis_st, self._axis_st_time = (qrs_axis, st_segment), now
                 else:
-                    pr_label.setText("-- ms")
-                    qrs_label.setText("-- ms")
-                    qtc_label.setText("-- ms")
-                    arrhythmia_label.setText("--")
+                    qrs_axis, st_segment = self._axis_st
+
+                if hasattr(self, 'dashboard_callback'):
+                    self.dashboard_callback({
+                        'Heart_Rate': heart_rate,
+                        'PR': pr_interval,
+                        'QRS': qrs_duration,
+                        'QTc': qtc_interval,
+                        'QRS_axis': qrs_axis,
+                        'ST': st_segment
+                    })
+
+                # --- Arrhythmia detection ---
+                arrhythmia_result = detect_arrhythmia(heart_rate, qrs_duration, rr_intervals)
+                arrhythmia_label.setText(arrhythmia_result)
             else:
-                line.set_data([], [])
-                ax.set_xlim(0, 1)
-                ax.set_ylim(-500, 500)
                 pr_label.setText("-- ms")
                 qrs_label.setText("-- ms")
                 qtc_label.setText("-- ms")
+                arrhythmia_label.setText("--")
+        else:
+            line.set_data([], [])
+            for label in "PQRST":
+                self._pqrst_markers[label].set_visible(False)
+                self._pqrst_texts[label].set_visible(False)
+            limits_changed = self._set_detail_limits((0, 1), (-500, 500))
+            pr_label.setText("-- ms")
+            qrs_label.setText("-- ms")
+            qtc_label.setText("-- ms")
+        if limits_changed or self._detail_background is None:
+            # Full redraw; _cache_detail_background recaches the axes and draws the trace
             canvas.draw_idle()
-        self._detailed_timer.timeout.connect(update_detailed_plot)
-        self._detailed_timer.start(100)
-        update_detailed_plot()  # Draw immediately on open
+            return
+        canvas.restore_region(self._detail_background)
+        self._draw_detail_artists()
+        canvas.blit(canvas.figure.bbox)
 
     def refresh_ports(self):
         self.port_combo.clear()
@@ -1498,11 +2042,9 @@ class ECGTestPage(QWidget):
                 if widget:
                     widget.setParent(None)
             self.plot_area.setLayout(None)
-        self.figures = []
-        self.canvases = []
         self.axs = []
         self.lines = []
-        grid = QGridLayout()
+        self._background = None
         n_leads = len(self.leads)
         if n_leads == 12:
             rows, cols = 3, 4
@@ -1510,30 +2052,13 @@ class ECGTestPage(QWidget):
             rows, cols = 2, 4
         else:
             rows, cols = 1, 1
+        # All leads share one figure and canvas: one renderer and one draw per frame instead of one per lead
+        self.fig = Figure(facecolor='#fafbfc', figsize=(6 * cols, 2.5 * rows))
+        gs = self.fig.add_gridspec(rows, cols, hspace=0.5, wspace=0.2)
+        trace_shadow = self.settings_manager.get_trace_shadow()
         for idx, lead in enumerate(self.leads):
             row, col = divmod(idx, cols)
-            group = QGroupBox(lead)
-            group.setStyleSheet("""
-                QGroupBox {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                        stop:0 #ffffff, stop:1 #f8f9fa);
-                    border: 2px solid #e9ecef;
-                    border-radius: 16px;
-                    color: #495057;
-                    font: bold 16px 'Segoe UI';
-                    margin-top: 12px;
-                    padding: 12px;
-                    box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-                }
-                QGroupBox:hover {
-                    border: 2px solid #ff6600;
-                    box-shadow: 0 6px 20px rgba(255,102,0,0.2);
-                    transform: translateY(-2px);
-                }
-            """)
-            vbox = QVBoxLayout(group)
-            fig = Figure(facecolor='#fafbfc', figsize=(6, 2.5))
-            ax = fig.add_subplot(111)
+            ax = self.fig.add_subplot(gs[row, col])
             ax.set_facecolor('#fafbfc')
             ylim = self.ylim if hasattr(self, 'ylim') else 400
             ax.set_ylim(-ylim, ylim)
@@ -1551,67 +2076,108 @@ class ECGTestPage(QWidget):
             ax.tick_params(axis='both', colors='#6c757d', labelsize=10)
             ax.tick_params(axis='x', length=0)
             ax.tick_params(axis='y', length=0)
+            ax.set_title(self._title_fmt.format(lead=lead),
+                         fontsize=8, color='#666', pad=10)
 
             # Enhanced line styling
-            import matplotlib.patheffects as path_effects 
-            line, = ax.plot([0]*self.buffer_size, 
-                            color=self.LEAD_COLORS.get(lead, '#ff6600'), 
+            line, = ax.plot(self._plot_scratch[idx], 
+                            color=self._lead_rgba[idx], 
                             lw=0.5, 
                             alpha=0.9,
-                            path_effects=[path_effects.SimpleLineShadow(offset=(1,1), alpha=0.3),
-                                        path_effects.Normal()])
+                            antialiased=False,  # Half-pixel traces rasterise much faster without AA
+                            animated=True,  # Drawn by redraw_leads over the cached figure background
+                            # Shadow is opt-in: it strokes every trace twice per frame
+                            path_effects=TRACE_PATH_EFFECTS if trace_shadow else [])
 
             self.lines.append(line)
-            canvas = FigureCanvas(fig)
-            vbox.addWidget(canvas)
-            grid.addWidget(group, row, col)
-            self.figures.append(fig)
-            self.canvases.append(canvas)
             self.axs.append(ax)
-        self.plot_area.setLayout(grid)
-        def make_expand_lead(idx):
-            return lambda event: self.expand_lead(idx)
-        for i, canvas in enumerate(self.canvases):
-            canvas.mpl_connect('button_press_event', make_expand_lead(i))
+        self.canvas = FigureCanvas(self.fig)
+        # The Agg buffer covers the whole widget, so Qt need not clear the background first
+        self.canvas.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.canvas.setAttribute(Qt.WA_NoSystemBackground, True)
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.canvas)
+        self.plot_area.setLayout(layout)
+        self.canvas.mpl_connect('button_press_event', self.on_lead_clicked)
+        self.canvas.mpl_connect('draw_event', self.cache_lead_background)
+
+    def on_lead_clicked(self, event):
+        if event.inaxes in self.axs:
+            self.expand_lead(self.axs.index(event.inaxes))
+
+    def cache_lead_background(self, event=None):
+        # Called after every full draw (including resizes): keep the static axes, then put the traces back on top
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for ax, line in zip(self.axs, self.lines):
+            ax.draw_artist(line)
+
+    def redraw_leads(self):
+        if self._count == 0:
+            return
+        scratch, lines, canvas = self._plot_scratch, self.lines, self.canvas
+        np.multiply(self._centered, self._gain_factor, out=scratch)
+        for row, line in zip(scratch, lines):
+            # Same rows every frame; set_ydata only marks the line for recaching
+            line.set_ydata(row)
+        if self._background is None:
+            # Not drawn yet; the draw_event handler renders the traces
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self._background)
+        for ax, line in zip(self.axs, lines):
+            ax.draw_artist(line)
+        canvas.blit(self.fig.bbox)
+
+    def refresh_views(self):
+        started = time.perf_counter()
+        self.sync_buffer_views()
+        # Hidden views keep their dirty flag and catch up on the first frame after they are shown again
+        if self._dirty['grid'] and self.plot_area.isVisible():
+            self.redraw_leads()
+            self._dirty['grid'] = False
+        if self._dirty['detail'] and self._detail_updater and self.detailed_widget.isVisible():
+            self._detail_updater()
+            self._dirty['detail'] = False
+        if self._dirty['overlay'] and self._overlay_updater:
+            self._overlay_updater()
+            self._dirty['overlay'] = False
+        if self._dirty['metrics']:
+            self.update_live_metrics()
+            self._dirty['metrics'] = False
+        self.update_elapsed_time()
+        if self.is_recording:
+            self.capture_frame()
+        self.adapt_frame_rate(time.perf_counter() - started)
+
+    def adapt_frame_rate(self, frame_cost):
+        # Stretch the frame interval when drawing can't keep up, so timeouts don't pile up in the
+        # event queue, and return to the target rate once frames get cheap again
+        self._frame_cost = 0.8 * self._frame_cost + 0.2 * frame_cost
+        interval = min(self.MAX_FRAME_INTERVAL_MS, max(self.FRAME_INTERVAL_MS, int(self._frame_cost * 1200)))
+        if abs(interval - self.draw_timer.interval()) > 5:
+            self.draw_timer.setInterval(interval)
 
     def redraw_all_plots(self):
         
         if hasattr(self, 'lines') and self.lines:
+            self.sync_buffer_views()
+            np.multiply(self._centered, self._gain_factor, out=self._plot_scratch)
             for i, line in enumerate(self.lines):
                 if i < len(self.leads):
-                    lead = self.leads[i]
-                    data = self.data.get(lead, [])
-                    
-                    if len(data) > 0:
+                    if self._count > 0:
                         # Apply current settings to the real data
-                        gain_factor = self.settings_manager.get_wave_gain() / 10.0
-                        centered = (np.array(data) - np.nanmean(data)) * gain_factor
-                        
-                        # Update line data with new buffer size
-                        if len(centered) < self.buffer_size:
-                            plot_data = np.full(self.buffer_size, np.nan)
-                            plot_data[-len(centered):] = centered
-                        else:
-                            plot_data = centered[-self.buffer_size:]
-                        
-                        line.set_ydata(plot_data)
+                        line.set_ydata(self._plot_scratch[i])
                         
                         # Update axis limits based on current settings
                         if i < len(self.axs):
                             ylim = self.ylim if hasattr(self, 'ylim') else 400
                             self.axs[i].set_ylim(-ylim, ylim)
                             self.axs[i].set_xlim(0, self.buffer_size)
-                            
-                            # Update plot title with current settings
-                            current_speed = self.settings_manager.get_wave_speed()
-                            current_gain = self.settings_manager.get_wave_gain()
-                            new_title = f"{lead} | Speed: {current_speed}mm/s | Gain: {current_gain}mm/mV"
-                            self.axs[i].set_title(new_title, fontsize=8, color='#666', pad=10)
-                            print(f"Redraw updated {lead} title: {new_title}")
-                        
-                        # Redraw canvas
-                        if i < len(self.canvases):
-                            self.canvases[i].draw_idle()
+            
+            # Redraw canvas
+            if self._count > 0:
+                self.canvas.draw_idle()
 
     # ---------------------- Start Button Functionality ----------------------
 
@@ -1634,18 +2200,18 @@ class ECGTestPage(QWidget):
                 return
             
             if self.serial_reader:
+                self.stop_serial_worker()
                 self.serial_reader.close()
             
             print(f"Connecting to {port} at {baud_int} baud...")
             self.serial_reader = SerialECGReader(port, baud_int)
             self.serial_reader.start()
-            self.timer.start(50)
-            if hasattr(self, '_12to1_timer'):
-                self._12to1_timer.start(100)
+            self.start_serial_worker()
+            self._frame_cost = 0.0
+            self.draw_timer.start(self.FRAME_INTERVAL_MS)
 
             # Start elapsed time tracking
             self.start_time = time.time()
-            self.elapsed_timer.start(1000)
                 
             print("Serial connection established successfully!")
             
@@ -1666,220 +2232,160 @@ class ECGTestPage(QWidget):
             
         if self.serial_reader:
             self.serial_reader.stop()
-        self.timer.stop()
-        if hasattr(self, '_12to1_timer'):
-            self._12to1_timer.stop()
+        self.stop_serial_worker()
+        if not self.is_recording:
+            self.draw_timer.stop()
 
         # Stop elapsed time tracking
-        self.elapsed_timer.stop()
         self.start_time = None
 
         # --- Calculate and update metrics on dashboard ---
         if hasattr(self, 'dashboard_callback'):
-            lead2_data = self.data.get("II", [])[-500:]
-            lead_I_data = self.data.get("I", [])[-500:]
-            lead_aVF_data = self.data.get("aVF", [])[-500:]
-            heart_rate = None
-            pr_interval = None
-            qrs_duration = None
-            qt_interval = None
-            qtc_interval = None
-            qrs_axis = "--"
-            st_segment = "--"
-            if len(lead2_data) > 100:
-                # Use same detection logic as live
-                from scipy.signal import find_peaks
-                sampling_rate = 500
-                ecg_signal = np.array(lead2_data)
-                centered = ecg_signal - np.mean(ecg_signal)
-                # R peak detection
-                r_peaks, _ = find_peaks(centered, distance=int(0.2 * sampling_rate), prominence=0.6 * np.std(centered))
-                # Q and S: local minima before and after R
-                q_peaks = []
-                s_peaks = []
-                for r in r_peaks:
-                    q_start = max(0, r - int(0.06 * sampling_rate))
-                    q_end = r
-                    if q_end > q_start:
-                        q_idx = np.argmin(centered[q_start:q_end]) + q_start
-                        q_peaks.append(q_idx)
-                    s_start = r
-                    s_end = min(len(centered), r + int(0.06 * sampling_rate))
-                    if s_end > s_start:
-                        s_idx = np.argmin(centered[s_start:s_end]) + s_start
-                        s_peaks.append(s_idx)
-                # P: positive peak before Q (within 0.1-0.2s)
-                p_peaks = []
-                for q in q_peaks:
-                    p_start = max(0, q - int(0.2 * sampling_rate))
-                    p_end = q - int(0.08 * sampling_rate)
-                    if p_end > p_start:
-                        p_candidates, _ = find_peaks(centered[p_start:p_end], prominence=0.1 * np.std(centered))
-                        if len(p_candidates) > 0:
-                            p_peaks.append(p_start + p_candidates[-1])
-                # T: positive peak after S (within 0.1-0.4s)
-                t_peaks = []
-                for s in s_peaks:
-                    t_start = s + int(0.08 * sampling_rate)
-                    t_end = min(len(centered), s + int(0.4 * sampling_rate))
-                    if t_end > t_start:
-                        t_candidates, _ = find_peaks(centered[t_start:t_end], prominence=0.1 * np.std(centered))
-                        if len(t_candidates) > 0:
-                            t_peaks.append(t_start + t_candidates[np.argmax(centered[t_start + t_candidates])])
-                # Calculate intervals
-                if len(r_peaks) > 1:
-                    rr_intervals = np.diff(r_peaks) / sampling_rate  # in seconds
-                    mean_rr = np.mean(rr_intervals)
-                    heart_rate = 60 / mean_rr if mean_rr > 0 else None
-                else:
-                    rr_intervals = None
-                    heart_rate = None
-                if len(p_peaks) > 0 and len(r_peaks) > 0:
-                    pr_interval = (r_peaks[-1] - p_peaks[-1]) * 1000 / sampling_rate  # ms
-                if len(q_peaks) > 0 and len(s_peaks) > 0:
-                    qrs_duration = (s_peaks[-1] - q_peaks[-1]) * 1000 / sampling_rate  # ms
-                if len(q_peaks) > 0 and len(t_peaks) > 0:
-                    qt_interval = (t_peaks[-1] - q_peaks[-1]) * 1000 / sampling_rate  # ms
-                if qt_interval and heart_rate:
-                    qtc_interval = qt_interval / np.sqrt(60 / heart_rate)  # Bazett's formula
+            # The analysis runs on the thread pool; it gets copies, as a restart would overwrite the ring buffer
+            lead2_data, lead_I_data, lead_aVF_data = (self.get_lead_data(lead)[-500:].copy() for lead in ("II", "I", "aVF"))
+            QThreadPool.globalInstance().start(
+                lambda: self._analyse_stopped_trace(lead2_data, lead_I_data, lead_aVF_data))
 
-                # QRS axis
-                qrs_axis = calculate_qrs_axis(lead_I_data, lead_aVF_data, r_peaks)
-
-                # ST segment
-                st_segment = calculate_st_segment(lead2_data, r_peaks, fs=sampling_rate)
-
-            self.dashboard_callback({
-                'Heart Rate': heart_rate,
-                'PR': pr_interval,
-                'QRS': qrs_duration,
-                'QTc': qtc_interval,
-                'QRS_axis': qrs_axis,
-                'ST': st_segment
-            })
+    def _analyse_stopped_trace(self, lead2_data, lead_I_data, lead_aVF_data):
+        # Runs on a pool thread; the dashboard is updated back on the GUI thread via dashboard_metrics_ready
+        try:
+            self.dashboard_metrics_ready.emit(self.summarise_lead_ii(lead2_data, lead_I_data, lead_aVF_data))
+        except Exception as e:
+            print("Error calculating dashboard metrics:", e)
 
-    def update_plot(self):
-        
-        if not self.serial_reader:
-            return
-        
-        line = self.serial_reader.ser.readline()
-        line_data = line.decode('utf-8', errors='replace').strip()
-        if not line_data:
+    def _deliver_dashboard_metrics(self, metrics):
+        if hasattr(self, 'dashboard_callback'):
+            self.dashboard_callback(metrics)
+
+    def summarise_lead_ii(self, lead2_data, lead_I_data, lead_aVF_data):
+        # Dashboard metrics for the last Lead II window; pure computation, safe off the GUI thread
+        heart_rate = None
+        pr_interval = None
+        qrs_duration = None
+        qt_interval = None
+        qtc_interval = None
+        qrs_axis = "--"
+        st_segment = "--"
+        if len(lead2_data) > 100:
+            # Use same detection logic as live
+            sampling_rate = 500
+            # One mean over the window; the subtraction itself yields the only copy needed
+            centered = lead2_data - lead2_data.mean()
+            p_peaks, q_peaks, r_peaks, s_peaks, t_peaks = detect_pqrst(centered, sampling_rate)
+            # Calculate intervals, kept in samples until the final scale to bpm / ms
+            ms_per_sample = 1000.0 / sampling_rate
+            if len(r_peaks) > 1:
+                mean_rr = np.diff(r_peaks).mean()
+                heart_rate = 60.0 * sampling_rate / mean_rr if mean_rr > 0 else None
+            if len(p_peaks) > 0 and len(r_peaks) > 0:
+                pr_interval = (r_peaks[-1] - p_peaks[-1]) * ms_per_sample
+            if len(q_peaks) > 0 and len(s_peaks) > 0:
+                qrs_duration = (s_peaks[-1] - q_peaks[-1]) * ms_per_sample
+            if len(q_peaks) > 0 and len(t_peaks) > 0:
+                qt_interval = (t_peaks[-1] - q_peaks[-1]) * ms_per_sample
+            if qt_interval and heart_rate:
+                qtc_interval = qt_interval / np.sqrt(60 / heart_rate)  # Bazett's formula
+
+            # QRS axis
+            qrs_axis = calculate_qrs_axis(lead_I_data, lead_aVF_data, r_peaks)
+
+            # ST segment
+            st_segment = calculate_st_segment(lead2_data, r_peaks, fs=sampling_rate)
+
+        return {
+            'Heart Rate': heart_rate,
+            'PR': pr_interval,
+            'QRS': qrs_duration,
+            'QTc': qtc_interval,
+            'QRS_axis': qrs_axis,
+            'ST': st_segment
+        }
+
+    def start_serial_worker(self):
+        self.serial_thread = QThread()
+        self.serial_worker = SerialWorker(self.serial_reader)
+        self.serial_worker.moveToThread(self.serial_thread)
+        self.serial_thread.started.connect(self.serial_worker.run)
+        # Queued across threads, so ingest_samples always runs on the UI thread
+        self.serial_worker.samples_ready.connect(self.ingest_samples)
+        self.serial_thread.start()
+
+    def stop_serial_worker(self):
+        if self.serial_thread is None:
             return
-        
+        self.serial_worker.stop()
+        if hasattr(self.serial_reader.ser, 'cancel_read'):
+            self.serial_reader.ser.cancel_read()  # Wake a pyserial read blocked on an idle port (non-POSIX path)
+        self.serial_thread.quit()
+        self.serial_thread.wait()
+        self.serial_thread = None
+        self.serial_worker = None
+
+    def ingest_samples(self, samples):
+        # The whole drained batch goes into the ring buffer in one compiled call
+        self._head, self._count = ingest_block(self._buf, self._head, self._count, self._sum, samples, self._lead_idx)
+        self._samples_in += len(samples)
+        # Only the ring buffer is written here; draw_timer unwraps it, repaints the views and refreshes
+        # the metrics on its next frame
+        self._buffer_stale = True
+        for view in self._dirty:
+            self._dirty[view] = True
+
+    def update_live_metrics(self):
         try:
-            values = [int(x) for x in line_data.split()]
-            if len(values) != 8:
-                return
-            lead1 = values[0]
-            v4    = values[1]
-            v5    = values[2]
-            lead2 = values[3]
-            v3    = values[4]
-            v6    = values[5]
-            v1    = values[6]
-            v2    = values[7]
-            lead3 = lead2 - lead1
-            avr = - (lead1 + lead2) / 2
-            avl = (lead1 - lead3) / 2
-            avf = (lead2 + lead3) / 2
-            lead_data = {
-                "I": lead1,
-                "II": lead2,
-                "III": lead3,
-                "aVR": avr,
-                "aVL": avl,
-                "aVF": avf,
-                "V1": v1,
-                "V2": v2,
-                "V3": v3,
-                "V4": v4,
-                "V5": v5,
-                "V6": v6
-            }
-            for i, lead in enumerate(self.leads):
-                self.data[lead].append(lead_data[lead])
-                if len(self.data[lead]) > self.buffer_size:
-                    self.data[lead].pop(0)
-            
-            # Write latest Lead II data to file for dashboard
-            try:
-                import json
-                with open('lead_ii_live.json', 'w') as f:
-                    json.dump(self.data["II"][-500:], f)
-            except Exception as e:
-                print("Error writing lead_ii_live.json:", e)
+            # Write latest Lead II data to file for dashboard, at most every LIVE_EXPORT_INTERVAL_S
+            now = time.perf_counter()
+            if now - self._last_live_export >= self.LIVE_EXPORT_INTERVAL_S:
+                self._last_live_export = now
+                try:
+                    with open('lead_ii_live.json', 'w') as f:
+                        json.dump(self.get_lead_data("II")[-500:].tolist(), f)
+                except Exception as e:
+                    print("Error writing lead_ii_live.json:", e)
             
             # Calculate and update ECG metrics in real-time
-            lead_ii_data = self.data.get("II", [])
-            if lead_ii_data:
-                intervals = self.calculate_ecg_intervals(lead_ii_data)
-                self.update_ecg_metrics_on_top_of_lead_graphs(intervals)
-            
-            for i, lead in enumerate(self.leads):
-                if len(self.data[lead]) > 0:
-                    if len(self.data[lead]) < self.buffer_size:
-                        data = np.full(self.buffer_size, np.nan)
-                        data[-len(self.data[lead]):] = self.data[lead]
-                    else:
-                        data = np.array(self.data[lead])
-                    
-                    centered = data - np.nanmean(data)
-
-                    # Apply current gain setting to the real data
-                    gain_factor = self.settings_manager.get_wave_gain() / 10.0
-                    centered = (data - np.nanmean(data)) * gain_factor
-                    
-                    self.lines[i].set_ydata(centered)
-                    
-                    # Use dynamic y-limits based on current gain setting
-                    ylim = self.ylim if hasattr(self, 'ylim') else 400
-                    self.axs[i].set_ylim(-ylim, ylim)
-                    
-                    # Use dynamic x-limits based on current buffer size
-                    self.axs[i].set_xlim(0, self.buffer_size)
-
-                    # Update title with current settings
-                    current_speed = self.settings_manager.get_wave_speed()
-                    current_gain = self.settings_manager.get_wave_gain()
-                    self.axs[i].set_title(f"{lead} | Speed: {current_speed}mm/s | Gain: {current_gain}mm/mV", 
-                                        fontsize=8, color='#666', pad=10)
-                    
-                    # Add grid lines to show scale
-                    self.axs[i].grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
-                    
-                    # Remove any existing labels
-                    self.axs[i].set_xlabel("")
-                    self.axs[i].set_ylabel("")
-                    
-                    self.canvases[i].draw_idle()
-                    
+            lead_ii_data = self.get_lead_data("II")
+            fresh = self._samples_in - self._intervals_at
+            if len(lead_ii_data) and not self._intervals_in_flight and fresh >= self.INTERVAL_MIN_NEW_SAMPLES:
+                # Pan-Tompkins runs on the thread pool and reports back through metrics_ready. The worker
+                # gets its own copy because the ring-buffer view is rewritten on the next tick
+                self._intervals_in_flight = True
+                self._intervals_at = self._samples_in
+                data = lead_ii_data.copy()
+                QThreadPool.globalInstance().start(lambda: self.metrics_ready.emit(self.calculate_ecg_intervals(data)))
         except Exception as e:
-            print("Error parsing ECG data:", e)
+            print("Error updating ECG metrics:", e)
+
+    def _queue_metrics(self, intervals):
+        self._intervals_in_flight = False
+        # Keep only the newest result; a flush already scheduled will pick it up
+        flush_pending = self._pending_metrics is not None
+        self._pending_metrics = intervals
+        if not flush_pending:
+            QTimer.singleShot(0, self._flush_metrics)
+
+    def _flush_metrics(self):
+        intervals, self._pending_metrics = self._pending_metrics, None
+        if intervals is not None:
+            try:
+                self.update_ecg_metrics_on_top_of_lead_graphs(intervals)
+            except Exception as e:
+                print("Error updating ECG metrics:", e)
 
     def export_pdf(self):
         path, _ = QFileDialog.getSaveFileName(self, "Export ECG Data as PDF", "", "PDF Files (*.pdf)")
         if path:
-            from matplotlib.backends.backend_pdf import PdfPages
             with PdfPages(path) as pdf:
-                for fig in self.figures:
-                    pdf.savefig(fig)
+                pdf.savefig(self.fig)
 
     def export_csv(self):
         path, _ = QFileDialog.getSaveFileName(self, "Export ECG Data as CSV", "", "CSV Files (*.csv)")
         if path:
-            with open(path, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(["Sample"] + self.leads)
-                for i in range(self.buffer_size):
-                    row = [i]
-                    for lead in self.leads:
-                        if i < len(self.data[lead]):
-                            row.append(self.data[lead][i])
-                        else:
-                            row.append("")
-                    writer.writerow(row)
+            # One row per recorded sample, oldest first
+            self.sync_buffer_views()
+            recorded = self._unwrap[:, self.buffer_size - self._count:].T
+            np.savetxt(path, np.column_stack((np.arange(self._count), recorded)), delimiter=',',
+                       header=','.join(["Sample"] + self.leads), comments='', fmt='%g')
 
     def go_back(self):
 
@@ -1907,8 +2413,7 @@ class ECGTestPage(QWidget):
                 widget.setParent(None)
 
     def show_sequential_view(self):
-        from ecg.lead_sequential_view import LeadSequentialView
-        win = LeadSequentialView(self.leads, self.data, buffer_size=500)
+        win = LeadSequentialView(self.leads, self.get_lead_data, buffer_size=500)
         win.show()
         self._sequential_win = win
 
@@ -1942,16 +2447,14 @@ class ECGTestPage(QWidget):
         # Store the current layout
         self._original_layout = self.plot_area.layout()
         
-        # Store the current figures, canvases, axes, and lines
-        self._original_figures = getattr(self, 'figures', [])
-        self._original_canvases = getattr(self, 'canvases', [])
+        # Store the current figure, canvas, axes, and lines
+        self._original_figure = getattr(self, 'fig', None)
+        self._original_canvas = getattr(self, 'canvas', None)
         self._original_axs = getattr(self, 'axs', [])
         self._original_lines = getattr(self, 'lines', [])
 
     def _create_overlay_widget(self):
         
-        from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QFrame
-        
         # Create overlay container
         self._overlay_widget = QWidget()
         self._overlay_widget.setStyleSheet("""
@@ -2074,10 +2577,6 @@ class ECGTestPage(QWidget):
 
     def _create_overlay_figure(self, overlay_layout):
         
-        from matplotlib.figure import Figure
-        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-        import numpy as np
-        
         # Create figure with all leads - adjust spacing for better visibility
         num_leads = len(self.leads)
         fig = Figure(figsize=(16, num_leads * 2.2), facecolor='none')  # Changed to transparent
@@ -2088,83 +2587,114 @@ class ECGTestPage(QWidget):
         self._overlay_axes = []
         self._overlay_lines = []
         
-        for idx, lead in enumerate(self.leads):
-            ax = fig.add_subplot(num_leads, 1, idx+1)
-            ax.set_facecolor('none')  # Changed to transparent
-            
-            # Remove all borders and spines
-            for spine in ax.spines.values():
-                spine.set_visible(False)
-            
-            # Remove all ticks and labels for cleaner look
-            ax.set_xticks([])
-            ax.set_yticks([])
+        # All leads share the x axis (same buffer); transparent, no spines and no ticks for a cleaner look
+        axes = fig.subplots(num_leads, 1, sharex=True, squeeze=False)[:, 0]
+        setp(axes, facecolor='none', xticks=[], yticks=[])
+        setp([spine for ax in axes for spine in ax.spines.values()], visible=False)
+        
+        for ax, lead in zip(axes, self.leads):
             ax.set_ylabel(lead, color='#00ff00', fontsize=12, fontweight='bold', labelpad=20)
             
-            # Create line with initial data
-            line, = ax.plot(np.arange(self.buffer_size), [np.nan]*self.buffer_size, color="#00ff00", lw=1.5)
+            # Create line with initial data; animated so it can be blitted over the cached overlay
+            line, = ax.plot(np.arange(self.buffer_size), [np.nan]*self.buffer_size, color="#00ff00", lw=1.5, animated=True)
             self._overlay_axes.append(ax)
             self._overlay_lines.append(line)
         
         self._overlay_canvas = FigureCanvas(fig)
         overlay_layout.addWidget(self._overlay_canvas)
+        self._overlay_background = None
+        self._overlay_canvas.mpl_connect('draw_event', self._cache_overlay_background)
         
-        # Start update timer for overlay
-        self._overlay_timer = QTimer(self)
-        self._overlay_timer.timeout.connect(self._update_overlay_plots)
-        self._overlay_timer.start(100)
+        # Refreshed by refresh_views along with the other views
+        self._overlay_updater = self._update_overlay_plots
+        self._update_overlay_plots()
+
+    def _cache_overlay_background(self, event=None):
+        # Everything but the traces (mode backgrounds, labels) is cached after each full draw
+        if not hasattr(self, '_overlay_canvas'):
+            return
+        self._overlay_background = self._overlay_canvas.copy_from_bbox(self._overlay_canvas.figure.bbox)
+        for ax, line in zip(self._overlay_axes, self._overlay_lines):
+            ax.draw_artist(line)
+
+    def _scaled_overlay_rows(self):
+        """
+        Gain-scaled centred samples of every lead, and the same rows stretched to buffer_size columns.
+        All leads share one fill level, so both are computed for the whole (lead, sample) block at once;
+        once the buffer is full no stretching is needed and the two are the same array.
+        """
+        self.sync_buffer_views()
+        n = self._count
+        # Centring already happened in center_leads (running means); this is the only pass over the samples
+        scaled = np.multiply(self._centered[:, self.buffer_size - n:], self._gain_factor,
+                             out=self._overlay_scratch[:, :n])
+        if n == 0 or n == self.buffer_size:
+            # Steady state: the full buffer is plotted as is, with no interpolation or per-lead copy
+            return scaled, scaled
+        if n == 1:
+            return scaled, np.repeat(scaled, self.buffer_size, axis=1)
+        # Linear interpolation between neighbouring samples, vectorised across leads; float32 positions keep
+        # the stretched block float32 like the rest of the overlay path
+        pos = self._stretch_base * (n - 1)
+        left = np.minimum(pos.astype(np.intp), n - 2)
+        frac = np.subtract(pos, left, dtype=np.float32)
+        return scaled, scaled[:, left] * (1.0 - frac) + scaled[:, left + 1] * frac
+
+    def _overlay_ylims(self, scaled):
+        # Dynamic y-limits for every lead from one min and one max reduction over the whole block
+        # (the +/-100 padding means the two can never coincide)
+        ymin = scaled.min(axis=1) - 100
+        ymax = scaled.max(axis=1) + 100
+        
+        # Ensure y-limits are reasonable; snapped to 100 so they (and the blit background) rarely change
+        ymin = np.maximum(-1000, np.floor(ymin / 100) * 100)
+        ymax = np.minimum(1000, np.ceil(ymax / 100) * 100)
+        return list(zip(ymin.tolist(), ymax.tolist()))
 
     def _update_overlay_plots(self):
         
         if not hasattr(self, '_overlay_lines') or not self._overlay_lines:
             return
         
+        limits_changed = False
+        scaled, stretched = self._scaled_overlay_rows()
+        ylims = self._overlay_ylims(scaled) if self._count > 0 else None
         for idx, lead in enumerate(self.leads):
             if idx < len(self._overlay_lines):
-                data = self.data.get(lead, [])
                 line = self._overlay_lines[idx]
                 ax = self._overlay_axes[idx]
                 
-                plot_data = np.full(self.buffer_size, np.nan)
+                # Lines take the rows as views; leads with no data yet share the all-NaN row
+                plot_data = self._nan_row
                 
-                if data and len(data) > 0:
-                    n = min(len(data), self.buffer_size)
-                    centered = np.array(data[-n:]) - np.mean(data[-n:])
-                    
-                    # Apply current gain setting
-                    gain_factor = self.settings_manager.get_wave_gain() / 10.0
-                    centered = centered * gain_factor
-                    
-                    if n < self.buffer_size:
-                        stretched = np.interp(
-                            np.linspace(0, n-1, self.buffer_size),
-                            np.arange(n),
-                            centered
-                        )
-                        plot_data[:] = stretched
-                    else:
-                        plot_data[-n:] = centered
-                    
-                    # Set dynamic y-limits based on data
-                    ymin = np.min(centered) - 100
-                    ymax = np.max(centered) + 100
-                    if ymin == ymax:
-                        ymin, ymax = -500, 500
-                    
-                    # Ensure y-limits are reasonable
-                    ymin = max(-1000, ymin)
-                    ymax = min(1000, ymax)
-                    
-                    ax.set_ylim(ymin, ymax)
+                if self._count > 0:
+                    plot_data = stretched[idx]
+                    ymin, ymax = ylims[idx]
                 else:
-                    ax.set_ylim(-500, 500)
+                    ymin, ymax = -500, 500
                 
-                # Set x-limits
-                ax.set_xlim(0, self.buffer_size-1)
+                # Axis limits only change the cached background when they actually move
+                if ax.get_ylim() != (ymin, ymax) or ax.get_xlim() != (0, self.buffer_size-1):
+                    ax.set_ylim(ymin, ymax)
+                    ax.set_xlim(0, self.buffer_size-1)
+                    limits_changed = True
                 line.set_ydata(plot_data)
         
-        if hasattr(self, '_overlay_canvas'):
+        self._blit_overlay(limits_changed)
+
+    def _blit_overlay(self, limits_changed):
+        # Shared by the stacked and two-column overlays: traces over the cached background, or a full
+        # redraw when the limits moved
+        if not hasattr(self, '_overlay_canvas'):
+            return
+        if limits_changed or self._overlay_background is None:
+            # Full redraw; the draw_event handler recaches the background and draws the traces
             self._overlay_canvas.draw_idle()
+            return
+        self._overlay_canvas.restore_region(self._overlay_background)
+        for ax, line in zip(self._overlay_axes, self._overlay_lines):
+            ax.draw_artist(line)
+        self._overlay_canvas.blit(self._overlay_canvas.figure.bbox)
 
     def _apply_current_overlay_mode(self):
 
@@ -2235,20 +2765,14 @@ class ECGTestPage(QWidget):
                 }
             """)
             
+            style = self.LIGHT_AXES_KW
             for ax in self._overlay_axes:
-                ax.set_facecolor('#ffffff')
-                ax.tick_params(axis='x', colors='#333333', labelsize=10)
-                ax.tick_params(axis='y', colors='#333333', labelsize=10)
-                ax.set_ylabel(ax.get_ylabel(), color='#333333', fontsize=14, fontweight='bold', labelpad=15)
-                for spine in ax.spines.values():
-                    spine.set_visible(True)
-                    spine.set_color('#333333')
-                    spine.set_linewidth(1.0)
-                ax.figure.canvas.draw()
+                ax.update(style['axes'])
+                ax.tick_params(axis='both', **style['ticks'])
+                ax.set_ylabel(ax.get_ylabel(), color=style['label'], fontsize=14, fontweight='bold', labelpad=15)
+                setp(list(ax.spines.values()), **style['spines'])
             
-            for line in self._overlay_lines:
-                line.set_color('#0066cc')
-                line.set_linewidth(2.0)
+            setp(self._overlay_lines, **style['lines'])
         
         elif mode == "dark":
             self.dark_mode_btn.setStyleSheet(active_button_style)
@@ -2260,17 +2784,14 @@ class ECGTestPage(QWidget):
                 }
             """)
             
+            style = self.DARK_AXES_KW
             for ax in self._overlay_axes:
-                ax.set_facecolor('#000')
-                ax.tick_params(axis='x', colors='#00ff00', labelsize=10)
-                ax.tick_params(axis='y', colors='#00ff00', labelsize=10)
-                ax.set_ylabel(ax.get_ylabel(), color='#00ff00', fontsize=14, fontweight='bold', labelpad=15)
-                for spine in ax.spines.values():
-                    spine.set_visible(False)
+                ax.update(style['axes'])
+                ax.tick_params(axis='both', **style['ticks'])
+                ax.set_ylabel(ax.get_ylabel(), color=style['label'], fontsize=14, fontweight='bold', labelpad=15)
+                setp(list(ax.spines.values()), **style['spines'])
             
-            for line in self._overlay_lines:
-                line.set_color('#00ff00')
-                line.set_linewidth(2.0)
+            setp(self._overlay_lines, **style['lines'])
         
         elif mode == "graph":
             self.graph_mode_btn.setStyleSheet(active_button_style)
@@ -2315,20 +2836,10 @@ class ECGTestPage(QWidget):
     def _apply_graph_mode(self):
         
         try:
-            import os
-            from PyQt5.QtGui import QPixmap
-            import matplotlib.image as mpimg
-            
             bg_path = "ecg_bgimg_test.png"
             if os.path.exists(bg_path):
-                # Load the background image
-                bg_img = QPixmap(bg_path)
-                if not bg_img.isNull():
-                    # Save temporary file for matplotlib
-                    temp_path = "temp_bg.png"
-                    bg_img.save(temp_path)
-                    bg_matplotlib = mpimg.imread(temp_path)
-                    
+                bg_matplotlib = _graph_background(bg_path)
+                if bg_matplotlib.size:
                     # Apply background to the entire figure first
                     if hasattr(self, '_overlay_canvas') and self._overlay_canvas.figure:
                         fig = self._overlay_canvas.figure
@@ -2350,18 +2861,12 @@ class ECGTestPage(QWidget):
                         )
                     
                     # Apply background to all axes
-                    for i, ax in enumerate(self._overlay_axes):
-                        # Set transparent background for subplots
-                        ax.set_facecolor('none')
+                    style = self.GRAPH_AXES_KW
+                    for ax in self._overlay_axes:
+                        # Transparent background, no spines and no ticks for a cleaner look
+                        ax.update(style['axes'])
                         ax.patch.set_alpha(0.0)
-                        
-                        # Remove all borders and spines
-                        for spine in ax.spines.values():
-                            spine.set_visible(False)
-                        
-                        # Remove ticks for cleaner look
-                        ax.set_xticks([])
-                        ax.set_yticks([])
+                        setp(list(ax.spines.values()), **style['spines'])
                         
                         # Set label color to dark for better visibility on grid background
                         ax.set_ylabel(ax.get_ylabel(), color='#333333', fontsize=12, fontweight='bold', labelpad=20)
@@ -2371,19 +2876,9 @@ class ECGTestPage(QWidget):
                         ax.set_ylim(-500, 500)
                     
                     # Change line colors to dark red for better visibility on grid background
-                    for line in self._overlay_lines:
-                        line.set_color('#cc0000')  # Darker red
-                        line.set_linewidth(2.5)
-                        line.set_alpha(1.0)
-                    
-                    # Clean up temporary file
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
+                    setp(self._overlay_lines, **style['lines'])
                     
-                    # Force redraw
-                    if hasattr(self, '_overlay_canvas'):
-                        self._overlay_canvas.draw()
-                        
+                    # The caller, _apply_overlay_mode, redraws the canvas once after the mode is applied
                     return
                         
                 else:
@@ -2436,10 +2931,8 @@ class ECGTestPage(QWidget):
         if not hasattr(self, '_overlay_active') or not self._overlay_active:
             return
         
-        # Stop overlay timer
-        if hasattr(self, '_overlay_timer'):
-            self._overlay_timer.stop()
-            self._overlay_timer.deleteLater()
+        # Stop overlay updates
+        self._overlay_updater = None
         
         # Find and remove overlay widget from main_vbox layout
         main_layout = self.grid_widget.layout()
@@ -2502,8 +2995,6 @@ class ECGTestPage(QWidget):
         self._apply_current_overlay_mode()
 
     def _create_two_column_overlay_widget(self):
-        from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QFrame
-        
         # Create overlay container
         self._overlay_widget = QWidget()
         self._overlay_widget.setStyleSheet("""
@@ -2625,10 +3116,6 @@ class ECGTestPage(QWidget):
         self._apply_overlay_mode("dark")
 
     def _create_two_column_figure(self, overlay_layout):
-        from matplotlib.figure import Figure
-        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-        import numpy as np
-        
         # Define the two columns of leads
         left_leads = ["I", "II", "III", "aVR", "aVL", "aVF"]
         right_leads = ["V1", "V2", "V3", "V4", "V5", "V6"]
@@ -2642,105 +3129,54 @@ class ECGTestPage(QWidget):
         self._overlay_axes = []
         self._overlay_lines = []
         
-        # Create left column (limb leads)
-        for idx, lead in enumerate(left_leads):
-            ax = fig.add_subplot(6, 2, 2*idx + 1)
-            ax.set_facecolor('none')
-            
-            # Remove all borders and spines
-
-            for spine in ax.spines.values():
-                spine.set_visible(False)
-            
-            # Remove all ticks and labels for cleaner look
-            ax.set_xticks([])
-            ax.set_yticks([])
-            ax.set_ylabel(lead, color='#00ff00', fontsize=12, fontweight='bold', labelpad=20)
-            
-            # Create line with initial data
-            line, = ax.plot(np.arange(self.buffer_size), [np.nan]*self.buffer_size, color="#00ff00", lw=1.5)
-            self._overlay_axes.append(ax)
-            self._overlay_lines.append(line)
+        # One 6x2 grid sharing the x axis (every trace spans the same buffer); invariant styling is applied
+        # to all axes at once: transparent, no spines, no ticks
+        grid = fig.subplots(6, 2, sharex=True)
+        setp(grid.flat, facecolor='none', xticks=[], yticks=[])
+        setp([spine for ax in grid.flat for spine in ax.spines.values()], visible=False)
         
-        # Create right column (chest leads)
-        for idx, lead in enumerate(right_leads):
-            ax = fig.add_subplot(6, 2, 2*idx + 2)
-            ax.set_facecolor('none')
-            
-            # Remove all borders and spines
-            for spine in ax.spines.values():
-                spine.set_visible(False)
-            
-            # Remove all ticks and labels for cleaner look
-            ax.set_xticks([])
-            ax.set_yticks([])
+        # Left column (limb leads) first, then the right column (chest leads)
+        for ax, lead in zip(list(grid[:, 0]) + list(grid[:, 1]), left_leads + right_leads):
             ax.set_ylabel(lead, color='#00ff00', fontsize=12, fontweight='bold', labelpad=20)
             
-            # Create line with initial data
-            line, = ax.plot(np.arange(self.buffer_size), [np.nan]*self.buffer_size, color="#00ff00", lw=1.5)
+            # Create line with initial data; animated so it can be blitted over the cached overlay
+            line, = ax.plot(np.arange(self.buffer_size), [np.nan]*self.buffer_size, color="#00ff00", lw=1.5, animated=True)
             self._overlay_axes.append(ax)
             self._overlay_lines.append(line)
+        # Buffer row of each subplot's lead, resolved once; None for leads this page doesn't acquire
+        self._two_column_rows = [self.leads.index(lead) if lead in self.leads else None
+                                 for lead in left_leads + right_leads]
         
         self._overlay_canvas = FigureCanvas(fig)
         overlay_layout.addWidget(self._overlay_canvas)
+        self._overlay_background = None
+        self._overlay_canvas.mpl_connect('draw_event', self._cache_overlay_background)
         
-        # Start update timer for overlay
-        self._overlay_timer = QTimer(self)
-        self._overlay_timer.timeout.connect(self._update_two_column_plots)
-        self._overlay_timer.start(100)
+        # Refreshed by refresh_views along with the other views
+        self._overlay_updater = self._update_two_column_plots
+        self._update_two_column_plots()
 
     def _update_two_column_plots(self):
         if not hasattr(self, '_overlay_lines') or not self._overlay_lines:
             return
         
-        # Define the two columns of leads
-        left_leads = ["I", "II", "III", "aVR", "aVL", "aVF"]
-        right_leads = ["V1", "V2", "V3", "V4", "V5", "V6"]
-        all_leads = left_leads + right_leads
-        
-        for idx, lead in enumerate(all_leads):
-            if idx < len(self._overlay_lines):
-                data = self.data.get(lead, [])
-                line = self._overlay_lines[idx]
-                ax = self._overlay_axes[idx]
-                
-                plot_data = np.full(self.buffer_size, np.nan)
-                
-                if data and len(data) > 0:
-                    n = min(len(data), self.buffer_size)
-                    centered = np.array(data[-n:]) - np.mean(data[-n:])
-                    
-                    # Apply current gain setting
-                    gain_factor = self.settings_manager.get_wave_gain() / 10.0
-                    centered = centered * gain_factor
-                    
-                    if n < self.buffer_size:
-                        stretched = np.interp(
-                            np.linspace(0, n-1, self.buffer_size),
-                            np.arange(n),
-                            centered
-                        )
-                        plot_data[:] = stretched
-                    else:
-                        plot_data[-n:] = centered
-                    
-                    # Set dynamic y-limits based on data
-                    ymin = np.min(centered) - 100
-                    ymax = np.max(centered) + 100
-                    if ymin == ymax:
-                        ymin, ymax = -500, 500
-                    
-                    # Ensure y-limits are reasonable
-                    ymin = max(-1000, ymin)
-                    ymax = min(1000, ymax)
-                    
-                    ax.set_ylim(ymin, ymax)
-                else:
-                    ax.set_ylim(-500, 500)
-                
-                # Set x-limits
+        limits_changed = False
+        scaled, stretched = self._scaled_overlay_rows()
+        ylims = self._overlay_ylims(scaled) if self._count > 0 else None
+        for ax, line, row in zip(self._overlay_axes, self._overlay_lines, self._two_column_rows):
+            plot_data = self._nan_row
+            
+            if self._count > 0 and row is not None:
+                plot_data = stretched[row]
+                ymin, ymax = ylims[row]
+            else:
+                ymin, ymax = -500, 500
+            
+            # Axis limits only change the cached background when they actually move
+            if ax.get_ylim() != (ymin, ymax) or ax.get_xlim() != (0, self.buffer_size-1):
+                ax.set_ylim(ymin, ymax)
                 ax.set_xlim(0, self.buffer_size-1)
-                line.set_ydata(plot_data)
+                limits_changed = True
+            line.set_ydata(plot_data)
         
-        if hasattr(self, '_overlay_canvas'):
-            self._overlay_canvas.draw_idle()
\ No newline at end of file
+        self._blit_overlay(limits_changed)
\ No newline at end of file
@@ -1,14 +1,11 @@
 import sys
 import os
-import json
 from PyQt5.QtWidgets import (
     QApplication, QDialog, QLabel, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout, QMessageBox, QStackedWidget, QWidget, QInputDialog, QSizePolicy
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThreadPool
 from PyQt5.QtGui import QFont, QPixmap
 from auth.sign_in import SignIn
-from auth.sign_out import SignOut
-from dashboard.dashboard import Dashboard
 from splash_screen import SplashScreen
 from ecg.pan_tompkins import pan_tompkins
 
@@ -20,45 +17,34 @@ def resource_path(relative_path):
     return os.path.join(os.path.abspath("."), relative_path)
 
 
-USER_DATA_FILE = resource_path("users.json")
-
-
-def load_users():
-    if os.path.exists(USER_DATA_FILE):
-        with open(USER_DATA_FILE, "r") as f:
-            return json.load(f)
-    return {}
-
-
-def save_users(users):
-    with open(USER_DATA_FILE, "w") as f:
-        json.dump(users, f)
-
-
 # Login/Register Dialog
 class LoginRegisterDialog(QDialog):
-    def __init__(self):
+    # Built once with the class and shared by every dialog instance, instead of a literal per construction
+    DIALOG_QSS = """
+        QDialog { background: #fafbfc; border-radius: 18px; }
+        QLabel#AppTitle { color: #2453ff; font-size: 26px; font-weight: bold; }
+        QLabel#Headline { color: #2453ff; font-size: 22px; font-weight: bold; }
+        QLabel#Welcome { color: #222; font-size: 13px; }
+        QLineEdit { border: 1.5px solid #2453ff; border-radius: 4px; padding: 8px 12px; font-size: 15px; background: #fff; }
+        QPushButton#LoginBtn { background: #2453ff; color: white; border-radius: 4px; padding: 8px 0; font-size: 16px; font-weight: bold; }
+        QPushButton#LoginBtn:hover { background: #1a3bb3; }
+        QPushButton#SignUpBtn { background: #fff; color: #2453ff; border: 1.5px solid #2453ff; border-radius: 4px; padding: 8px 0; font-size: 16px; font-weight: bold; }
+        QPushButton#SignUpBtn:hover { background: #eaf0ff; }
+        QCheckBox { font-size: 13px; }
+        QLabel#Social { color: #2453ff; font-size: 13px; font-weight: bold; }
+        QPushButton#SocialBtn { background: none; color: #2453ff; border: none; font-size: 13px; text-decoration: underline; }
+        QPushButton#SocialBtn:hover { color: #1a3bb3; }
+    """
+    LINE_EDIT_QSS = "border: 2px solid #ff6600; border-radius: 8px; padding: 6px 10px; font-size: 15px; background: #f7f7f7; color: #222;"
+
+    def __init__(self, users=None):
         super().__init__()
         self.setWindowTitle("CardioX by Deckmount - Sign In / Sign Up")
         self.setMinimumSize(800, 500)
         self.setWindowFlags(self.windowFlags() | Qt.WindowMinMaxButtonsHint)
-        self.setStyleSheet("""
-            QDialog { background: #fafbfc; border-radius: 18px; }
-            QLabel#AppTitle { color: #2453ff; font-size: 26px; font-weight: bold; }
-            QLabel#Headline { color: #2453ff; font-size: 22px; font-weight: bold; }
-            QLabel#Welcome { color: #222; font-size: 13px; }
-            QLineEdit { border: 1.5px solid #2453ff; border-radius: 4px; padding: 8px 12px; font-size: 15px; background: #fff; }
-            QPushButton#LoginBtn { background: #2453ff; color: white; border-radius: 4px; padding: 8px 0; font-size: 16px; font-weight: bold; }
-            QPushButton#LoginBtn:hover { background: #1a3bb3; }
-            QPushButton#SignUpBtn { background: #fff; color: #2453ff; border: 1.5px solid #2453ff; border-radius: 4px; padding: 8px 0; font-size: 16px; font-weight: bold; }
-            QPushButton#SignUpBtn:hover { background: #eaf0ff; }
-            QCheckBox { font-size: 13px; }
-            QLabel#Social { color: #2453ff; font-size: 13px; font-weight: bold; }
-            QPushButton#SocialBtn { background: none; color: #2453ff; border: none; font-size: 13px; text-decoration: underline; }
-            QPushButton#SocialBtn:hover { color: #1a3bb3; }
-        """)
+        self.setStyleSheet(self.DIALOG_QSS)
         from auth.sign_in import SignIn
-        self.sign_in_logic = SignIn()
+        self.sign_in_logic = SignIn(users)
         self.init_ui()
         self.result = False
         self.username = None
@@ -191,14 +177,21 @@ class LoginRegisterDialog(QDialog):
         self.bg_label.setGeometry(0, 0, self.width(), self.height())
         event.accept()
 
+    def _make_line(self, placeholder, password=False):
+        # Every form field shares the same size policy and style
+        line = QLineEdit()
+        line.setPlaceholderText(placeholder)
+        if password:
+            line.setEchoMode(QLineEdit.Password)
+        line.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        line.setStyleSheet(self.LINE_EDIT_QSS)
+        return line
+
     def create_login_widget(self):
         widget = QWidget()
         layout = QVBoxLayout()
-        self.login_email = QLineEdit()
-        self.login_email.setPlaceholderText("Email Address")
-        self.login_password = QLineEdit()
-        self.login_password.setPlaceholderText("Password")
-        self.login_password.setEchoMode(QLineEdit.Password)
+        self.login_email = self._make_line("Email Address")
+        self.login_password = self._make_line("Password", password=True)
         login_btn = QPushButton("Login")
         login_btn.setObjectName("LoginBtn")
         login_btn.setStyleSheet("background: #ff6600; color: white; border-radius: 10px; padding: 8px 0; font-size: 16px; font-weight: bold;")
@@ -207,10 +200,8 @@ class LoginRegisterDialog(QDialog):
         phone_btn.setObjectName("SignUpBtn")
         phone_btn.setStyleSheet("background: #ff6600; color: white; border-radius: 10px; padding: 8px 0; font-size: 16px; font-weight: bold;")
         phone_btn.clicked.connect(self.handle_phone_login)
-        for w in [self.login_email, self.login_password, login_btn, phone_btn]:
+        for w in [login_btn, phone_btn]:
             w.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.login_email.setStyleSheet("border: 2px solid #ff6600; border-radius: 8px; padding: 6px 10px; font-size: 15px; background: #f7f7f7; color: #222;")
-        self.login_password.setStyleSheet("border: 2px solid #ff6600; border-radius: 8px; padding: 6px 10px; font-size: 15px; background: #f7f7f7; color: #222;")
         layout.addWidget(self.login_email)
         layout.addWidget(self.login_password)
         layout.addWidget(login_btn)
@@ -254,30 +245,17 @@ class LoginRegisterDialog(QDialog):
     def create_register_widget(self):
         widget = QWidget()
         layout = QVBoxLayout()
-        self.reg_name = QLineEdit()
-        self.reg_name.setPlaceholderText("Full Name")
-        self.reg_age = QLineEdit()
-        self.reg_age.setPlaceholderText("Age")
-        self.reg_gender = QLineEdit()
-        self.reg_gender.setPlaceholderText("Gender")
-        self.reg_address = QLineEdit()
-        self.reg_address.setPlaceholderText("Address")
-        self.reg_phone = QLineEdit()
-        self.reg_phone.setPlaceholderText("Phone Number")
-        self.reg_password = QLineEdit()
-        self.reg_password.setPlaceholderText("Password")
-        self.reg_password.setEchoMode(QLineEdit.Password)
-        self.reg_confirm = QLineEdit()
-        self.reg_confirm.setPlaceholderText("Confirm Password")
-        self.reg_confirm.setEchoMode(QLineEdit.Password)
+        self.reg_name = self._make_line("Full Name")
+        self.reg_age = self._make_line("Age")
+        self.reg_gender = self._make_line("Gender")
+        self.reg_address = self._make_line("Address")
+        self.reg_phone = self._make_line("Phone Number")
+        self.reg_password = self._make_line("Password", password=True)
+        self.reg_confirm = self._make_line("Confirm Password", password=True)
         register_btn = QPushButton("Sign Up")
         register_btn.setObjectName("SignUpBtn")
         register_btn.clicked.connect(self.handle_register)
-        for w in [self.reg_name, self.reg_age, self.reg_gender, self.reg_address, self.reg_phone, self.reg_password, self.reg_confirm, register_btn]:
-            w.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        # Apply dashboard color coding
-        for w in [self.reg_name, self.reg_age, self.reg_gender, self.reg_address, self.reg_phone, self.reg_password, self.reg_confirm]:
-            w.setStyleSheet("border: 2px solid #ff6600; border-radius: 8px; padding: 6px 10px; font-size: 15px; background: #f7f7f7; color: #222;")
+        register_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         register_btn.setStyleSheet("background: #ff6600; color: white; border-radius: 10px; padding: 8px 0; font-size: 16px; font-weight: bold;")
         register_btn.setMinimumHeight(36)
         layout.addWidget(self.reg_name)
@@ -432,13 +410,17 @@ def main():
     splash.finish(login)
     while True:
         if login.exec_() == QDialog.Accepted and login.result:
+            # Imported on first login so the splash and login dialog don't wait on the dashboard's dependencies
+            from dashboard.dashboard import Dashboard
             dashboard = Dashboard(username=login.username, role=None)
             dashboard.show()
             app.exec_()
-            # After dashboard closes (sign out), show login again (reuse dialog)
-            login = LoginRegisterDialog()
+            # After dashboard closes (sign out), show login again with the users already in memory
+            login = LoginRegisterDialog(users=login.sign_in_logic.users)
         else:
             break
+    # Let a users.json save started by a late registration finish before exiting
+    QThreadPool.globalInstance().waitForDone()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,8 @@
+from functools import lru_cache
+from PyQt5.QtGui import QFont
+
+@lru_cache(maxsize=None)
+def cached_font(family, size, weight=-1):
+    # QFont is implicitly shared, so one instance per (family, size, weight) serves every widget.
+    # Built on first use rather than at import so no font is created before the QApplication.
+    return QFont(family, size, weight)
@@ -1,23 +1,29 @@
 from PyQt5.QtWidgets import QLabel
 from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import Qt, QPropertyAnimation, pyqtProperty
+from PyQt5.QtCore import Qt, QTimer, pyqtProperty
+
+BEAT_PEAK_SCALE = 1.18
 
 class HeartbeatLabel(QLabel):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._scale = 1.0
         self._pixmap = QPixmap(r"assets/vheart2.png")
+        # Rest and peak frames are scaled once up front and swapped, instead of rescaling on every animation step
+        self._frames = {}
         if not self._pixmap.isNull():
             self.setPixmap(self._pixmap.scaledToWidth(120, Qt.SmoothTransformation))
+            for scale in (1.0, BEAT_PEAK_SCALE):
+                size = int(120 * scale)
+                self._frames[scale] = self._pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
         self.setAlignment(Qt.AlignHCenter | Qt.AlignBottom)
         self.setStyleSheet("margin-top: 16px; margin-bottom: 0; filter: drop-shadow(0px 0px 12px #ff6600);")
-        self.anim = QPropertyAnimation(self, b"scale")
-        self.anim.setDuration(700)
-        self.anim.setStartValue(1.0)
-        self.anim.setKeyValueAt(0.5, 1.18)
-        self.anim.setEndValue(1.0)
-        self.anim.setLoopCount(-1)
-        self.anim.start()
+        self.beat_timer = QTimer(self)
+        self.beat_timer.timeout.connect(self.toggle_beat)
+        self.beat_timer.start(350)  # Half of the 700 ms beat
+
+    def toggle_beat(self):
+        self.setScale(BEAT_PEAK_SCALE if self._scale == 1.0 else 1.0)
 
     def getScale(self):
         return self._scale
@@ -25,8 +31,11 @@ class HeartbeatLabel(QLabel):
     def setScale(self, scale):
         self._scale = scale
         if not self._pixmap.isNull():
-            size = int(120 * scale)
-            self.setPixmap(self._pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            frame = self._frames.get(scale)
+            if frame is None:
+                size = int(120 * scale)
+                frame = self._pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            self.setPixmap(frame)
 
     scale = pyqtProperty(float, fget=getScale, fset=setScale)
 
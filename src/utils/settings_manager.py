@@ -10,6 +10,7 @@ class SettingsManager:
             "lead_sequence": "Standard",
             "sampling_mode": "Simultaneous",
             "demo_function": "Off",
+            "trace_shadow": "Off",  # Drop shadow under live traces; doubles their raster cost
             "storage": "SD",
             "serial_port": "Select Port",
             "baud_rate": "115200"
@@ -47,6 +48,9 @@ class SettingsManager:
     def get_wave_gain(self):
         return float(self.get_setting("wave_gain"))
 
+    def get_trace_shadow(self):
+        return self.get_setting("trace_shadow") == "On"
+
     def get_serial_port(self):
         return self.get_setting("serial_port")
     